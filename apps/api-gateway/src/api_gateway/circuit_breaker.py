@@ -0,0 +1,78 @@
+"""Per-endpoint circuit breakers for downstream service calls."""
+
+from __future__ import annotations
+
+from time import monotonic
+
+from .config import get_settings
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker that admits one probe per cooldown once open.
+
+    A ``failure_threshold`` of ``0`` disables the breaker.
+    """
+
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def allow(self) -> bool:
+        if not self._tripped():
+            return True
+        now = monotonic()
+        if now < self._retry_at:
+            return False
+        # Half-open: let this caller probe and hold everyone else for another cooldown.
+        self._retry_at = now + self._reset_seconds
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        if self._failure_threshold <= 0:
+            return
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._retry_at = monotonic() + self._reset_seconds
+
+    def _tripped(self) -> bool:
+        return 0 < self._failure_threshold <= self._failures
+
+
+class CircuitBreakerRegistry:
+    """Lazily created breakers keyed by downstream base URL."""
+
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, base_url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(base_url)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=self._failure_threshold,
+                reset_seconds=self._reset_seconds,
+            )
+            self._breakers[base_url] = breaker
+        return breaker
+
+    def reset(self) -> None:
+        self._breakers.clear()
+
+
+_settings = get_settings()
+_registry = CircuitBreakerRegistry(
+    failure_threshold=max(_settings.downstream_breaker_failure_threshold, 0),
+    reset_seconds=_settings.downstream_breaker_reset_seconds,
+)
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Expose the breaker registry singleton for helpers and tests."""
+
+    return _registry
@@ -1,5 +1,10 @@
 """Runtime configuration for API gateway."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+
+from pydantic import PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,54 +29,108 @@ class Settings(BaseSettings):
     )
     blockchain_connect_timeout_seconds: float = 15.0
     blockchain_verification_timeout_seconds: float = 8.0
+    blockchain_hedge_delay_seconds: float = 1.0
     sensor_ingestion_base_url: str = "http://127.0.0.1:8100"
     sensor_telemetry_timeout_seconds: float = 8.0
+    sensor_telemetry_cache_ttl_seconds: float = 2.0
+    downstream_read_cache_ttl_seconds: float = 2.0
     report_generation_base_url: str = "http://127.0.0.1:8202"
     report_generation_timeout_seconds: float = 15.0
     orchestration_base_url: str = "http://127.0.0.1:8200"
     orchestration_timeout_seconds: float = 8.0
+    downstream_breaker_failure_threshold: int = 5
+    downstream_breaker_reset_seconds: float = 30.0
 
     model_config = SettingsConfigDict(env_prefix="API_GATEWAY_", extra="ignore")
 
+    _auth_tokens: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _token_roles: dict[str, frozenset[str]] = PrivateAttr(default_factory=dict)
+    _blockchain_verification_urls: list[str] = PrivateAttr(default_factory=list)
+
+    @field_validator(
+        "blockchain_verification_base_url",
+        "sensor_ingestion_base_url",
+        "report_generation_base_url",
+        "orchestration_base_url",
+    )
+    @classmethod
+    def _strip_trailing_slash(cls, value: str) -> str:
+        return value.strip().rstrip("/")
+
+    @field_validator(
+        "blockchain_connect_timeout_seconds",
+        "blockchain_verification_timeout_seconds",
+        "sensor_telemetry_timeout_seconds",
+        "report_generation_timeout_seconds",
+        "orchestration_timeout_seconds",
+    )
+    @classmethod
+    def _clamp_timeout(cls, value: float) -> float:
+        return max(value, 0.1)
+
+    @model_validator(mode="after")
+    def _parse_csv_fields(self) -> Settings:
+        self._auth_tokens = _parse_auth_tokens(self.auth_bearer_tokens_csv)
+        self._token_roles = _parse_token_roles(self.auth_token_roles_csv)
+        self._blockchain_verification_urls = _parse_urls(
+            self.blockchain_verification_base_url,
+            self.blockchain_verification_fallback_urls_csv,
+        )
+        return self
+
     @property
-    def auth_tokens(self) -> set[str]:
-        tokens = [token.strip() for token in self.auth_bearer_tokens_csv.split(",")]
-        return {token for token in tokens if token}
+    def auth_tokens(self) -> frozenset[str]:
+        return self._auth_tokens
 
     @property
-    def token_roles(self) -> dict[str, set[str]]:
-        mapping: dict[str, set[str]] = {}
-        pairs = [value.strip() for value in self.auth_token_roles_csv.split(",")]
-        for pair in pairs:
-            if not pair or ":" not in pair:
-                continue
-            token, raw_roles = pair.split(":", 1)
-            token_value = token.strip()
-            if not token_value:
-                continue
-            roles = {
-                role.strip().lower()
-                for role in raw_roles.split("|")
-                if role.strip()
-            }
-            if roles:
-                mapping[token_value] = roles
-        return mapping
+    def token_roles(self) -> dict[str, frozenset[str]]:
+        return self._token_roles
 
     @property
     def blockchain_verification_urls(self) -> list[str]:
-        urls: list[str] = []
-        for candidate in [
-            self.blockchain_verification_base_url,
-            *self.blockchain_verification_fallback_urls_csv.split(","),
-        ]:
-            value = candidate.strip()
-            if value and value not in urls:
-                urls.append(value)
-        return urls
+        return self._blockchain_verification_urls
+
+
+def _parse_auth_tokens(raw: str) -> frozenset[str]:
+    tokens = [token.strip() for token in raw.split(",")]
+    return frozenset(token for token in tokens if token)
+
 
+def _parse_token_roles(raw: str) -> dict[str, frozenset[str]]:
+    mapping: dict[str, frozenset[str]] = {}
+    pairs = [value.strip() for value in raw.split(",")]
+    for pair in pairs:
+        if not pair or ":" not in pair:
+            continue
+        token, raw_roles = pair.split(":", 1)
+        token_value = token.strip()
+        if not token_value:
+            continue
+        roles = frozenset(
+            role.strip().lower()
+            for role in raw_roles.split("|")
+            if role.strip()
+        )
+        if roles:
+            mapping[token_value] = roles
+    return mapping
 
+
+def _parse_urls(base_url: str, fallback_csv: str) -> list[str]:
+    urls: list[str] = []
+    for candidate in [base_url, *fallback_csv.split(",")]:
+        value = candidate.strip().rstrip("/")
+        if value and value not in urls:
+            urls.append(value)
+    return urls
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return settings object."""
+    """Return process-wide settings object.
+
+    Settings are parsed once per process; call ``get_settings.cache_clear()``
+    after mutating the environment in tests.
+    """
 
     return Settings()
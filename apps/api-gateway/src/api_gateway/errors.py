@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
+from itertools import count
+from secrets import token_hex
 from typing import Any
-from uuid import uuid4
 
-from fastapi.responses import JSONResponse
+from fastapi import Request
+from fastapi.responses import Response
+
+from .serialization import dumps
+
+_UTC = timezone.utc
+_now = datetime.now
+_request_id_prefix = f"req_{token_hex(6)}"
+_request_counter = count()
+
+
+def _reseed_request_ids() -> None:
+    # Forked workers would otherwise mint the same ids as their parent.
+    global _request_id_prefix, _request_counter
+    _request_id_prefix = f"req_{token_hex(6)}"
+    _request_counter = count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_request_ids)
 
 
 class ApiError(Exception):
@@ -29,12 +50,13 @@ class ApiError(Exception):
         self.details = details
 
 
-def build_meta() -> dict[str, str]:
+def build_meta() -> dict[str, Any]:
     """Construct standard meta object for success responses."""
 
+    # ``timestamp`` stays a datetime so ApiMeta does not re-parse an ISO string.
     return {
-        "request_id": f"req_{uuid4().hex[:24]}",
-        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "request_id": f"{_request_id_prefix}{next(_request_counter) & 0xFFFFFFFFFFFF:012x}",
+        "timestamp": _now(_UTC),
     }
 
 
@@ -45,16 +67,27 @@ def error_response(
     message: str,
     trace_id: str | None,
     details: list[dict[str, Any]] | None = None,
-) -> JSONResponse:
+) -> Response:
     """Build standard error envelope response."""
 
-    payload: dict[str, Any] = {
-        "error": {
-            "code": code,
-            "message": message,
-            "trace_id": trace_id or f"trc_{uuid4().hex[:8]}",
-        }
+    error: dict[str, Any] = {
+        "code": code,
+        "message": message,
+        "trace_id": trace_id or f"trc_{token_hex(4)}",
     }
     if details:
-        payload["error"]["details"] = details
-    return JSONResponse(status_code=status_code, content=payload)
+        error["details"] = details
+    return Response(content=dumps({"error": error}), status_code=status_code, media_type="application/json")
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return whether ``If-None-Match`` on ``request`` matches ``etag``."""
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored on both sides.
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
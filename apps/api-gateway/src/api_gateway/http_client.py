@@ -0,0 +1,38 @@
+"""Shared pooled HTTP client for downstream service calls."""
+
+from __future__ import annotations
+
+import os
+
+import httpx
+
+_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=256)
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide async client, creating it on first use."""
+
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(limits=_LIMITS, follow_redirects=True)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release its pooled connections."""
+
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _forget_client_after_fork() -> None:
+    # A forked worker must not reuse the parent's pooled sockets.
+    global _client
+    _client = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_client_after_fork)
@@ -2,27 +2,61 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import hashlib
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import FileResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .config import get_settings
-from .errors import ApiError, error_response
+from .errors import ApiError, error_response, etag_matches
+from .http_client import close_http_client
 from .observability import configure_logging, get_metrics
 from .routes import router
 
 settings = get_settings()
 configure_logging(settings.log_level)
 
-app = FastAPI(title=settings.service_name, version=settings.service_version)
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await close_http_client()
+
+
+app = FastAPI(title=settings.service_name, version=settings.service_version, lifespan=_lifespan)
 app.include_router(router)
 _metrics = get_metrics()
+
+
+def _skip_metric() -> None:
+    return None
+
+
+_record_error = _metrics.record_error if settings.metrics_enabled else _skip_metric
+_record_rate_limited = _metrics.record_rate_limited if settings.metrics_enabled else _skip_metric
 _dashboard_root = Path(__file__).resolve().parents[3] / "dashboard-web"
 _dashboard_index = _dashboard_root / "index.html"
 _dashboard_static_dir = _dashboard_root / "src"
+_dashboard_index_html = _dashboard_index.read_bytes() if _dashboard_index.exists() else None
+_dashboard_index_etag = (
+    f'"{hashlib.sha256(_dashboard_index_html).hexdigest()[:32]}"'
+    if _dashboard_index_html is not None
+    else ""
+)
+_STATUS_TO_CODE = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    409: "CONFLICT",
+    422: "UNPROCESSABLE_ENTITY",
+    429: "RATE_LIMITED",
+}
 
 if _dashboard_static_dir.exists():
     app.mount(
@@ -33,18 +67,22 @@ if _dashboard_static_dir.exists():
 
 
 @app.get("/dashboard", include_in_schema=False)
-async def dashboard() -> FileResponse:
-    if not _dashboard_index.exists():
+async def dashboard(request: Request) -> Response:
+    if _dashboard_index_html is None:
         raise HTTPException(status_code=404, detail="Dashboard web assets not found.")
-    return FileResponse(_dashboard_index)
+    headers = {"etag": _dashboard_index_etag}
+    if etag_matches(request, _dashboard_index_etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=_dashboard_index_html, headers=headers)
 
 
+# Exception handlers stay ``async``: Starlette dispatches sync handlers through
+# ``run_in_threadpool``, which costs more than the coroutine they would save.
 @app.exception_handler(ApiError)
 async def handle_api_error(request: Request, exc: ApiError):
-    if settings.metrics_enabled:
-        _metrics.record_error()
-        if exc.status_code == 429:
-            _metrics.record_rate_limited()
+    _record_error()
+    if exc.status_code == 429:
+        _record_rate_limited()
     return error_response(
         status_code=exc.status_code,
         code=exc.code,
@@ -56,18 +94,8 @@ async def handle_api_error(request: Request, exc: ApiError):
 
 @app.exception_handler(HTTPException)
 async def handle_http_exception(request: Request, exc: HTTPException):
-    if settings.metrics_enabled:
-        _metrics.record_error()
-    status_to_code = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        409: "CONFLICT",
-        422: "UNPROCESSABLE_ENTITY",
-        429: "RATE_LIMITED",
-    }
-    code = status_to_code.get(exc.status_code, "INTERNAL_SERVER_ERROR")
+    _record_error()
+    code = _STATUS_TO_CODE.get(exc.status_code, "INTERNAL_SERVER_ERROR")
     return error_response(
         status_code=exc.status_code,
         code=code,
@@ -78,11 +106,12 @@ async def handle_http_exception(request: Request, exc: HTTPException):
 
 @app.exception_handler(RequestValidationError)
 async def handle_validation_error(request: Request, exc: RequestValidationError):
-    if settings.metrics_enabled:
-        _metrics.record_error()
+    _record_error()
     details = [
         {
-            "field": ".".join(str(part) for part in err.get("loc", [])),
+            "field": ".".join(
+                part if type(part) is str else str(part) for part in err.get("loc", ())
+            ),
             "issue": err.get("msg", "invalid value"),
         }
         for err in exc.errors()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime, timezone
-import json
 import logging
 from threading import Lock
 from typing import Any
 
+from .serialization import dumps
+
+_UTC = timezone.utc
+_now = datetime.now
+
 
 def configure_logging(level: str) -> None:
     """Configure service logging format once."""
@@ -21,19 +26,52 @@ def configure_logging(level: str) -> None:
 def log_event(logger: logging.Logger, event: str, **fields: Any) -> None:
     """Emit one structured JSON log line."""
 
+    if not logger.isEnabledFor(logging.INFO):
+        return
     payload = {
-        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "timestamp": _now(_UTC).isoformat(),
         "event": event,
         **fields,
     }
-    logger.info(json.dumps(payload, default=str, separators=(",", ":")))
+    logger.info(dumps(payload, default=str).decode("utf-8"))
+
+
+_PROMETHEUS_TOTALS_TEMPLATE = (
+    b"# HELP infraguard_api_gateway_requests_total Total gateway requests.\n"
+    b"# TYPE infraguard_api_gateway_requests_total counter\n"
+    b"infraguard_api_gateway_requests_total %d\n"
+    b"# HELP infraguard_api_gateway_errors_total Total gateway errors.\n"
+    b"# TYPE infraguard_api_gateway_errors_total counter\n"
+    b"infraguard_api_gateway_errors_total %d\n"
+    b"# HELP infraguard_api_gateway_rate_limited_total Total rate-limited requests.\n"
+    b"# TYPE infraguard_api_gateway_rate_limited_total counter\n"
+    b"infraguard_api_gateway_rate_limited_total %d\n"
+)
+_PROMETHEUS_PATH_TEMPLATE = b'infraguard_api_gateway_requests_path_total{path="%s"} %d\n'
+
+
+_PATH_LABEL_TABLE = str.maketrans({"/": "_", "-": "_"})
+
+
+def _path_label(path: str) -> bytes:
+    """Return the Prometheus-safe label for one route path."""
+
+    return (path.translate(_PATH_LABEL_TABLE).strip("_") or "root").encode("utf-8")
 
 
 class GatewayMetrics:
-    """Thread-safe in-memory metrics for gateway requests."""
+    """In-memory metrics for gateway requests.
+
+    Counters are plain ints updated without the lock: every recorder runs on
+    the event loop thread, since all routes and exception handlers are
+    ``async``. A sync route or handler would run in the threadpool and could
+    lose updates, which the test suite guards against. The lock only guards
+    ``reset`` and the scrape snapshot.
+    """
 
     def __init__(self) -> None:
         self._lock = Lock()
+        self._path_labels: dict[str, bytes] = {}
         self.reset()
 
     def reset(self) -> None:
@@ -41,40 +79,33 @@ class GatewayMetrics:
             self.requests_total = 0
             self.errors_total = 0
             self.rate_limited_total = 0
-            self.requests_by_path: dict[str, int] = {}
+            self.requests_by_path: defaultdict[str, int] = defaultdict(int)
 
     def record_request(self, path: str) -> None:
-        with self._lock:
-            self.requests_total += 1
-            self.requests_by_path[path] = self.requests_by_path.get(path, 0) + 1
+        # Callers pass route string literals, which are already interned.
+        self.requests_total += 1
+        self.requests_by_path[path] += 1
 
     def record_error(self) -> None:
-        with self._lock:
-            self.errors_total += 1
+        self.errors_total += 1
 
     def record_rate_limited(self) -> None:
-        with self._lock:
-            self.rate_limited_total += 1
+        self.rate_limited_total += 1
 
-    def render_prometheus(self) -> str:
+    def render_prometheus(self) -> bytes:
         with self._lock:
-            lines = [
-                "# HELP infraguard_api_gateway_requests_total Total gateway requests.",
-                "# TYPE infraguard_api_gateway_requests_total counter",
-                f"infraguard_api_gateway_requests_total {self.requests_total}",
-                "# HELP infraguard_api_gateway_errors_total Total gateway errors.",
-                "# TYPE infraguard_api_gateway_errors_total counter",
-                f"infraguard_api_gateway_errors_total {self.errors_total}",
-                "# HELP infraguard_api_gateway_rate_limited_total Total rate-limited requests.",
-                "# TYPE infraguard_api_gateway_rate_limited_total counter",
-                f"infraguard_api_gateway_rate_limited_total {self.rate_limited_total}",
-            ]
-            for path, count in sorted(self.requests_by_path.items()):
-                safe_path = path.replace("/", "_").replace("-", "_").strip("_") or "root"
-                lines.append(
-                    f"infraguard_api_gateway_requests_path_total{{path=\"{safe_path}\"}} {count}"
-                )
-        return "\n".join(lines) + "\n"
+            totals = (self.requests_total, self.errors_total, self.rate_limited_total)
+            paths = sorted(self.requests_by_path.items())
+
+        chunks = [_PROMETHEUS_TOTALS_TEMPLATE % totals]
+        chunks.extend(_PROMETHEUS_PATH_TEMPLATE % (self._label(path), value) for path, value in paths)
+        return b"".join(chunks)
+
+    def _label(self, path: str) -> bytes:
+        label = self._path_labels.get(path)
+        if label is None:
+            label = self._path_labels[path] = _path_label(path)
+        return label
 
 
 _metrics = GatewayMetrics()
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
-import json
+from functools import partial
+from itertools import count
 import logging
-import socket
+from time import monotonic, monotonic_ns
 from typing import Annotated
-from urllib import error as url_error
-from urllib import request as url_request
 
+import httpx
 from fastapi import APIRouter, Depends, Query, Request
-from pydantic import ValidationError
-from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from fastapi.responses import PlainTextResponse, Response
 
+from .circuit_breaker import CircuitBreaker, get_circuit_breakers
 from .config import get_settings
-from .errors import ApiError, build_meta
+from .errors import ApiError, build_meta, etag_matches
+from .http_client import get_http_client
 from .observability import get_metrics, log_event
 from .schemas import (
     AssetListResponse,
@@ -48,7 +52,8 @@ from .schemas import (
     VerificationSubmitResponse,
     VerificationSubmitResult,
 )
-from .security import AuthContext, enforce_rate_limit, get_auth_context, require_roles
+from .serialization import dumps, loads
+from .security import AuthContext, role_guard
 from .store import get_store
 
 router = APIRouter()
@@ -57,87 +62,278 @@ logger = logging.getLogger("api_gateway")
 _settings = get_settings()
 _metrics = get_metrics()
 _store = get_store()
+_breakers = get_circuit_breakers()
+_READ_CACHE_MAX_ENTRIES = 4096
+_ERROR_BODY_LIMIT_BYTES = 4096
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_ACCEPT_JSON_HEADERS = {"accept": "application/json"}
+_SEND_JSON_HEADERS = {"accept": "application/json", "content-type": "application/json"}
+_authorized = role_guard()
+_require_organization = role_guard("organization")
+_require_organization_or_operator = role_guard("organization", "operator")
+_INCIDENT_LIST_ADAPTER = TypeAdapter(list[AutomationIncident])
+_EVIDENCE_LIST_ADAPTER = TypeAdapter(list[EvidenceItem])
+_HEALTH_DEPENDENCIES = {
+    "database": DependencyHealth(status="ok", latency_ms=6),
+    "event_stream": DependencyHealth(status="ok", latency_ms=4),
+    "blockchain_verifier": DependencyHealth(status="ok", latency_ms=7),
+}
+
+# Downstream HTTP statuses passed through to the caller, keyed by (service, status):
+# (error code, message). Non-404 entries prefer the clipped upstream body as message.
+_DOWNSTREAM_HTTP_ERRORS: dict[tuple[str, int], tuple[str, str]] = {
+    ("verification", 400): ("BAD_REQUEST", "Verification request failed with HTTP 400."),
+    ("verification", 401): ("FORBIDDEN", "Verification request failed with HTTP 401."),
+    ("verification", 403): ("FORBIDDEN", "Verification request failed with HTTP 403."),
+    ("verification", 404): ("NOT_FOUND", "Verification record not found."),
+    ("verification", 409): ("CONFLICT", "Verification request conflict."),
+    ("orchestration", 404): ("NOT_FOUND", "Automation incident not found."),
+    ("orchestration", 409): ("CONFLICT", "Automation request conflict."),
+    ("report_generation", 400): ("BAD_REQUEST", "Report generation request failed with HTTP 400."),
+    ("report_generation", 401): ("FORBIDDEN", "Report generation request failed with HTTP 401."),
+    ("report_generation", 403): ("FORBIDDEN", "Report generation request failed with HTTP 403."),
+    ("report_generation", 404): ("NOT_FOUND", "Requested evidence resource not found."),
+    ("report_generation", 409): ("CONFLICT", "Evidence request conflict."),
+}
+
+_trace_counter = count()
+_health_cache: tuple[float, HealthCheckResponse] | None = None
+_read_cache: dict[str, tuple[float, dict]] = {}
+_read_inflight: dict[str, asyncio.Task[dict]] = {}
 
 
 def _trace_id(request: Request) -> str:
-    return request.headers.get("x-trace-id") or f"trc_{datetime.now(tz=timezone.utc).strftime('%H%M%S%f')[:12]}"
+    return (
+        request.headers.get("x-trace-id")
+        or f"trc_{monotonic_ns() & 0xFFFFFFFFFFFF:012x}{next(_trace_counter) & 0xFFF:03x}"
+    )
 
 
-def _with_metrics(path: str) -> None:
-    if _settings.metrics_enabled:
-        _metrics.record_request(path)
+def _skip_metric(_path: str) -> None:
+    return None
 
 
-def _connect_blockchain_service(trace_id: str) -> dict:
-    timeout_seconds = max(_settings.blockchain_connect_timeout_seconds, 0.1)
-    attempts: list[str] = []
-    timed_out = False
-
-    for base_url in _settings.blockchain_verification_urls:
-        endpoint = f"{base_url.rstrip('/')}/onchain/connect"
-        request = url_request.Request(
-            url=endpoint,
-            data=b"{}",
-            method="POST",
-            headers={
-                "content-type": "application/json",
-                "x-trace-id": trace_id,
-            },
+_with_metrics = _metrics.record_request if _settings.metrics_enabled else _skip_metric
+
+
+def _transport_reason(exc: httpx.HTTPError) -> str:
+    return str(exc) or type(exc).__name__
+
+
+def _error_details(response: httpx.Response) -> str:
+    return response.content[:_ERROR_BODY_LIMIT_BYTES].decode("utf-8", errors="ignore")
+
+
+def _raise_mapped_http_error(service: str, status_code: int, details: str, trace_id: str) -> None:
+    """Raise the caller-facing error for a mapped downstream status; return if unmapped."""
+
+    mapped = _DOWNSTREAM_HTTP_ERRORS.get((service, status_code))
+    if mapped is None:
+        return
+    code, fallback_message = mapped
+    message = fallback_message if status_code == 404 else (details[:180] or fallback_message)
+    raise ApiError(status_code=status_code, code=code, message=message, trace_id=trace_id)
+
+
+def _record_outcome(breaker: CircuitBreaker, response: httpx.Response) -> None:
+    # Any answer below 500 proves the service is up, even a 4xx.
+    if response.is_server_error:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def _request_content(trace_id: str, body: dict | BaseModel | None) -> tuple[bytes | None, dict[str, str]]:
+    if body is None:
+        return None, {**_ACCEPT_JSON_HEADERS, "x-trace-id": trace_id}
+    headers = {**_SEND_JSON_HEADERS, "x-trace-id": trace_id}
+    if isinstance(body, BaseModel):
+        # Models encode straight to wire bytes without an intermediate dict.
+        return body.model_dump_json(exclude_none=True).encode("utf-8"), headers
+    return dumps(body), headers
+
+
+def _json_object(response: httpx.Response, *, code: str, label: str, trace_id: str) -> dict:
+    """Decode a downstream JSON object body, raising ``code`` as a 502 otherwise."""
+
+    try:
+        parsed = loads(response.content)
+    except ValueError as exc:
+        raise ApiError(
+            status_code=502,
+            code=code,
+            message=f"{label} returned invalid JSON.",
+            trace_id=trace_id,
+        ) from exc
+
+    if not isinstance(parsed, dict):
+        raise ApiError(
+            status_code=502,
+            code=code,
+            message=f"{label} returned an unsupported payload shape.",
+            trace_id=trace_id,
         )
+    return parsed
+
+
+async def _request_downstream(
+    *,
+    service: str,
+    label: str,
+    code_prefix: str,
+    base_url: str,
+    path: str,
+    method: str,
+    timeout_seconds: float,
+    trace_id: str,
+    body: dict | BaseModel | None = None,
+    check_error: Callable[[httpx.Response], None] | None = None,
+) -> dict:
+    """Call one downstream endpoint and map every failure to an ``ApiError``.
+
+    Transport failures become ``{code_prefix}_TIMEOUT``/``_UNAVAILABLE``, as do
+    calls refused by the base URL's open circuit breaker. Error responses go
+    through ``check_error`` first, then the shared ``_DOWNSTREAM_HTTP_ERRORS``
+    table for ``service``, then ``{code_prefix}_ERROR``.
+    """
+
+    breaker = _breakers.get(base_url)
+    if not breaker.allow():
+        raise ApiError(
+            status_code=503,
+            code=f"{code_prefix}_UNAVAILABLE",
+            message=f"{label} unavailable: circuit open after repeated failures.",
+            trace_id=trace_id,
+        )
+
+    payload, headers = _request_content(trace_id, body)
+    try:
+        response = await get_http_client().request(
+            method,
+            f"{base_url}{path}",
+            content=payload,
+            headers=headers,
+            timeout=timeout_seconds,
+        )
+    except httpx.TimeoutException as exc:
+        breaker.record_failure()
+        raise ApiError(
+            status_code=504,
+            code=f"{code_prefix}_TIMEOUT",
+            message=f"{label} timed out after {timeout_seconds:.1f}s.",
+            trace_id=trace_id,
+        ) from exc
+    except httpx.HTTPError as exc:
+        breaker.record_failure()
+        raise ApiError(
+            status_code=503,
+            code=f"{code_prefix}_UNAVAILABLE",
+            message=f"{label} unreachable: {_transport_reason(exc)}",
+            trace_id=trace_id,
+        ) from exc
+
+    _record_outcome(breaker, response)
+    if response.is_error:
+        if check_error is not None:
+            check_error(response)
+        details = _error_details(response)
+        _raise_mapped_http_error(service, response.status_code, details, trace_id)
+        raise ApiError(
+            status_code=502,
+            code=f"{code_prefix}_ERROR",
+            message=f"{label} HTTP {response.status_code}: {details[:180]}",
+            trace_id=trace_id,
+        )
+
+    return _json_object(response, code=f"{code_prefix}_BAD_RESPONSE", label=label, trace_id=trace_id)
+
+
+async def _first_result(
+    attempt: Callable[[str], Awaitable[dict | None]],
+    base_urls: list[str],
+    hedge_delay_seconds: float | None,
+) -> dict | None:
+    """Race ``attempt`` across base URLs and return the first result.
+
+    The next URL starts as soon as a running attempt misses (returns ``None``)
+    or once ``hedge_delay_seconds`` pass without an answer; ``None`` disables
+    hedging so URLs are tried strictly one after another. An ``ApiError`` from
+    any attempt is final unless another attempt finished with a result in the
+    same round. Attempts still in flight are cancelled once a winner or final
+    error is known.
+    """
+
+    pending: set[asyncio.Task[dict | None]] = set()
+    started = 0
+    try:
+        while started < len(base_urls) or pending:
+            if started < len(base_urls):
+                pending.add(asyncio.create_task(attempt(base_urls[started])))
+                started += 1
+            hedge = hedge_delay_seconds if started < len(base_urls) else None
+            done, pending = await asyncio.wait(pending, timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+            failure: BaseException | None = None
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    failure = failure or error
+                elif (result := task.result()) is not None:
+                    return result
+            if failure is not None:
+                raise failure
+    finally:
+        for task in pending:
+            task.cancel()
+    return None
+
+
+async def _connect_blockchain_service(trace_id: str) -> dict:
+    timeout_seconds = _settings.blockchain_connect_timeout_seconds
+    attempts: list[str] = []
+    client = get_http_client()
+    headers = {**_SEND_JSON_HEADERS, "x-trace-id": trace_id}
+
+    async def attempt(base_url: str) -> dict | None:
+        endpoint = f"{base_url}/onchain/connect"
+        breaker = _breakers.get(base_url)
+        if not breaker.allow():
+            attempts.append(f"{base_url} -> circuit open")
+            return None
         try:
-            with url_request.urlopen(request, timeout=timeout_seconds) as response:
-                payload = response.read().decode("utf-8")
-        except url_error.HTTPError as exc:
-            details = exc.read().decode("utf-8", errors="ignore")
-            if exc.code in {404, 405}:
-                attempts.append(f"{base_url} -> HTTP {exc.code}")
-                continue
+            response = await client.post(endpoint, content=b"{}", headers=headers, timeout=timeout_seconds)
+        except httpx.TimeoutException:
+            breaker.record_failure()
+            attempts.append(f"{base_url} -> timeout")
+            return None
+        except httpx.HTTPError as exc:
+            breaker.record_failure()
+            attempts.append(f"{base_url} -> {_transport_reason(exc)}")
+            return None
+
+        _record_outcome(breaker, response)
+        if response.is_error:
+            if response.status_code in {404, 405}:
+                attempts.append(f"{base_url} -> HTTP {response.status_code}")
+                return None
             raise ApiError(
                 status_code=502,
                 code="BLOCKCHAIN_SERVICE_ERROR",
-                message=f"Blockchain service HTTP {exc.code}: {details[:180]}",
+                message=f"Blockchain service HTTP {response.status_code}: {_error_details(response)[:180]}",
                 trace_id=trace_id,
-            ) from exc
-        except url_error.URLError as exc:
-            attempts.append(f"{base_url} -> {exc.reason}")
-            continue
-        except (TimeoutError, socket.timeout):
-            timed_out = True
-            attempts.append(f"{base_url} -> timeout")
-            continue
-        except OSError as exc:
-            attempts.append(f"{base_url} -> {exc}")
-            continue
+            )
 
-        try:
-            body = json.loads(payload)
-        except json.JSONDecodeError as exc:
-            raise ApiError(
-                status_code=502,
-                code="BLOCKCHAIN_BAD_RESPONSE",
-                message="Blockchain service returned invalid JSON.",
-                trace_id=trace_id,
-            ) from exc
+        return _json_object(response, code="BLOCKCHAIN_BAD_RESPONSE", label="Blockchain service", trace_id=trace_id)
 
-        if not isinstance(body, dict):
-            raise ApiError(
-                status_code=502,
-                code="BLOCKCHAIN_BAD_RESPONSE",
-                message="Blockchain service returned an unsupported payload shape.",
-                trace_id=trace_id,
-            )
+    body = await _first_result(
+        attempt,
+        _settings.blockchain_verification_urls,
+        _settings.blockchain_hedge_delay_seconds,
+    )
+    if body is not None:
         return body
 
-    summary = "; ".join(attempts[:3]) or "no endpoint attempts recorded"
-    if timed_out and not attempts:
-        raise ApiError(
-            status_code=504,
-            code="BLOCKCHAIN_TIMEOUT",
-            message=f"Blockchain service timed out after {timeout_seconds:.1f}s.",
-            trace_id=trace_id,
-        )
-
-    if timed_out and attempts and all(attempt.endswith("timeout") for attempt in attempts):
+    if attempts and all(entry.endswith("timeout") for entry in attempts):
         raise ApiError(
             status_code=504,
             code="BLOCKCHAIN_TIMEOUT",
@@ -145,6 +341,7 @@ def _connect_blockchain_service(trace_id: str) -> dict:
             trace_id=trace_id,
         )
 
+    summary = "; ".join(attempts[:3]) or "no endpoint attempts recorded"
     raise ApiError(
         status_code=503,
         code="BLOCKCHAIN_UNAVAILABLE",
@@ -153,95 +350,70 @@ def _connect_blockchain_service(trace_id: str) -> dict:
     )
 
 
-def _request_blockchain_verification(
+async def _request_blockchain_verification(
     *,
     trace_id: str,
     method: str,
     path: str,
-    body: dict | None = None,
+    body: dict | BaseModel | None = None,
 ) -> dict:
-    timeout_seconds = max(_settings.blockchain_verification_timeout_seconds, 0.1)
+    timeout_seconds = _settings.blockchain_verification_timeout_seconds
     attempts: list[str] = []
-    timed_out = False
-
-    payload = None
-    headers = {
-        "accept": "application/json",
-        "x-trace-id": trace_id,
-    }
-    if body is not None:
-        payload = json.dumps(body).encode("utf-8")
-        headers["content-type"] = "application/json"
-
-    for base_url in _settings.blockchain_verification_urls:
-        endpoint = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
-        request = url_request.Request(
-            url=endpoint,
-            data=payload,
-            method=method,
-            headers=headers,
-        )
-
+    client = get_http_client()
+
+    payload, headers = _request_content(trace_id, body)
+    # Only reads are hedged. Writes such as /track are never sent to two URLs at
+    # once, but they still fail over serially after a timeout, transport error or
+    # unmapped error status, any of which the previous URL may have applied.
+    idempotent = method in _IDEMPOTENT_METHODS
+
+    async def attempt(base_url: str) -> dict | None:
+        endpoint = f"{base_url}{path}"
+        breaker = _breakers.get(base_url)
+        if not breaker.allow():
+            attempts.append(f"{base_url} -> circuit open")
+            return None
         try:
-            with url_request.urlopen(request, timeout=timeout_seconds) as response:
-                raw = response.read().decode("utf-8")
-        except url_error.HTTPError as exc:
-            details = exc.read().decode("utf-8", errors="ignore")
-            if exc.code == 404:
-                raise ApiError(
-                    status_code=404,
-                    code="NOT_FOUND",
-                    message="Verification record not found.",
-                    trace_id=trace_id,
-                ) from exc
-            if exc.code == 409:
-                raise ApiError(
-                    status_code=409,
-                    code="CONFLICT",
-                    message=details[:180] or "Verification request conflict.",
-                    trace_id=trace_id,
-                ) from exc
-            if exc.code in {400, 401, 403}:
-                raise ApiError(
-                    status_code=exc.code,
-                    code="BAD_REQUEST" if exc.code == 400 else "FORBIDDEN",
-                    message=details[:180] or f"Verification request failed with HTTP {exc.code}.",
-                    trace_id=trace_id,
-                ) from exc
-
-            attempts.append(f"{base_url} -> HTTP {exc.code}")
-            continue
-        except url_error.URLError as exc:
-            attempts.append(f"{base_url} -> {exc.reason}")
-            continue
-        except (TimeoutError, socket.timeout):
-            timed_out = True
+            response = await client.request(
+                method,
+                endpoint,
+                content=payload,
+                headers=headers,
+                timeout=timeout_seconds,
+            )
+        except httpx.TimeoutException:
+            breaker.record_failure()
             attempts.append(f"{base_url} -> timeout")
-            continue
-        except OSError as exc:
-            attempts.append(f"{base_url} -> {exc}")
-            continue
-
-        try:
-            parsed = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ApiError(
-                status_code=502,
-                code="BAD_RESPONSE",
-                message="Blockchain verification service returned invalid JSON.",
-                trace_id=trace_id,
-            ) from exc
+            return None
+        except httpx.HTTPError as exc:
+            breaker.record_failure()
+            attempts.append(f"{base_url} -> {_transport_reason(exc)}")
+            return None
+
+        _record_outcome(breaker, response)
+        if response.is_error:
+            status_code = response.status_code
+            details = _error_details(response)
+            _raise_mapped_http_error("verification", status_code, details, trace_id)
+            attempts.append(f"{base_url} -> HTTP {status_code}")
+            return None
+
+        return _json_object(
+            response,
+            code="BAD_RESPONSE",
+            label="Blockchain verification service",
+            trace_id=trace_id,
+        )
 
-        if not isinstance(parsed, dict):
-            raise ApiError(
-                status_code=502,
-                code="BAD_RESPONSE",
-                message="Blockchain verification service returned unsupported payload shape.",
-                trace_id=trace_id,
-            )
+    parsed = await _first_result(
+        attempt,
+        _settings.blockchain_verification_urls,
+        _settings.blockchain_hedge_delay_seconds if idempotent else None,
+    )
+    if parsed is not None:
         return parsed
 
-    if timed_out and attempts and all(attempt.endswith("timeout") for attempt in attempts):
+    if attempts and all(entry.endswith("timeout") for entry in attempts):
         raise ApiError(
             status_code=504,
             code="TIMEOUT",
@@ -259,12 +431,8 @@ def _request_blockchain_verification(
 
 
 def _parse_maintenance_verification(raw: dict, trace_id: str) -> MaintenanceVerification:
-    data = dict(raw)
-    if data.get("confirmed_at") and not data.get("verified_at"):
-        data["verified_at"] = data["confirmed_at"]
-
     try:
-        validated = MaintenanceVerification.model_validate(data)
+        return MaintenanceVerification.model_validate(raw)
     except ValidationError as exc:
         raise ApiError(
             status_code=502,
@@ -273,276 +441,147 @@ def _parse_maintenance_verification(raw: dict, trace_id: str) -> MaintenanceVeri
             trace_id=trace_id,
         ) from exc
 
-    return validated
 
-
-def _fetch_sensor_telemetry(asset_id: str, trace_id: str) -> dict:
-    endpoint = (
-        f"{_settings.sensor_ingestion_base_url.rstrip('/')}"
-        f"/telemetry/assets/{asset_id}/latest"
-    )
-    request = url_request.Request(
-        url=endpoint,
-        method="GET",
-        headers={
-            "accept": "application/json",
-            "x-trace-id": trace_id,
-        },
-    )
-
-    timeout_seconds = max(_settings.sensor_telemetry_timeout_seconds, 0.1)
-
-    try:
-        with url_request.urlopen(request, timeout=timeout_seconds) as response:
-            payload = response.read().decode("utf-8")
-    except url_error.HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="ignore")
-        if exc.code == 404:
+async def _fetch_sensor_telemetry(asset_id: str, trace_id: str) -> dict:
+    def telemetry_not_found(response: httpx.Response) -> None:
+        if response.status_code == 404:
             raise ApiError(
                 status_code=404,
                 code="NOT_FOUND",
                 message=f"Telemetry unavailable for asset: {asset_id}",
                 trace_id=trace_id,
-            ) from exc
-        raise ApiError(
-            status_code=502,
-            code="SENSOR_INGESTION_ERROR",
-            message=f"Sensor ingestion HTTP {exc.code}: {details[:180]}",
-            trace_id=trace_id,
-        ) from exc
-    except url_error.URLError as exc:
-        raise ApiError(
-            status_code=503,
-            code="SENSOR_INGESTION_UNAVAILABLE",
-            message=f"Sensor ingestion service unreachable: {exc.reason}",
-            trace_id=trace_id,
-        ) from exc
-    except (TimeoutError, socket.timeout) as exc:
-        raise ApiError(
-            status_code=504,
-            code="SENSOR_INGESTION_TIMEOUT",
-            message=f"Sensor ingestion service timed out after {timeout_seconds:.1f}s.",
-            trace_id=trace_id,
-        ) from exc
-    except OSError as exc:
-        raise ApiError(
-            status_code=503,
-            code="SENSOR_INGESTION_UNAVAILABLE",
-            message=f"Sensor ingestion network error: {exc}",
-            trace_id=trace_id,
-        ) from exc
+            )
+
+    return await _request_downstream(
+        service="sensor_ingestion",
+        label="Sensor ingestion service",
+        code_prefix="SENSOR_INGESTION",
+        base_url=_settings.sensor_ingestion_base_url,
+        path=f"/telemetry/assets/{asset_id}/latest",
+        method="GET",
+        timeout_seconds=_settings.sensor_telemetry_timeout_seconds,
+        trace_id=trace_id,
+        check_error=telemetry_not_found,
+    )
 
+
+async def _cached_read(
+    key: str,
+    ttl_seconds: float,
+    fetch: Callable[[], Awaitable[dict]],
+    *,
+    trace_id: str,
+    bypass_cache: bool = False,
+) -> dict:
+    """Return ``fetch()``'s payload, sharing one upstream call per ``key``.
+
+    Results are reused for ``ttl_seconds`` and concurrent callers for the same
+    key await a single in-flight fetch. A shared fetch's ``ApiError`` is
+    re-raised with each caller's own ``trace_id``. Writes drop stale entries
+    through ``_forget_reads``.
+    """
+
+    if bypass_cache or ttl_seconds <= 0:
+        return await fetch()
+
+    cached = _read_cache.get(key)
+    if cached is not None and cached[0] > monotonic():
+        return cached[1]
+
+    task = _read_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _read_inflight[key] = task
+        task.add_done_callback(partial(_remember_read, key, ttl_seconds))
     try:
-        body = json.loads(payload)
-    except json.JSONDecodeError as exc:
+        return await asyncio.shield(task)
+    except ApiError as exc:
+        if exc.trace_id == trace_id:
+            raise
         raise ApiError(
-            status_code=502,
-            code="SENSOR_INGESTION_BAD_RESPONSE",
-            message="Sensor ingestion service returned invalid JSON.",
+            status_code=exc.status_code,
+            code=exc.code,
+            message=exc.message,
             trace_id=trace_id,
+            details=exc.details,
         ) from exc
 
-    if not isinstance(body, dict):
-        raise ApiError(
-            status_code=502,
-            code="SENSOR_INGESTION_BAD_RESPONSE",
-            message="Sensor ingestion service returned an unsupported payload shape.",
-            trace_id=trace_id,
-        )
-    return body
+
+def _remember_read(key: str, ttl_seconds: float, task: asyncio.Task[dict]) -> None:
+    # A fetch forgotten while in flight may predate a write, so it is not kept.
+    if _read_inflight.get(key) is not task:
+        return
+    del _read_inflight[key]
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    now = monotonic()
+    if len(_read_cache) >= _READ_CACHE_MAX_ENTRIES:
+        for stale in [stale for stale, (expires_at, _) in _read_cache.items() if expires_at <= now]:
+            del _read_cache[stale]
+        if len(_read_cache) >= _READ_CACHE_MAX_ENTRIES:
+            _read_cache.clear()
+    _read_cache[key] = (now + ttl_seconds, task.result())
+
+
+def _forget_reads(*keys: str) -> None:
+    for key in keys:
+        _read_cache.pop(key, None)
+        _read_inflight.pop(key, None)
 
 
-def _request_orchestration(
+def _bypass_read_cache(request: Request) -> bool:
+    return "no-store" in request.headers.get("cache-control", "")
+
+
+async def _request_orchestration(
     *,
     trace_id: str,
     method: str,
     path: str,
-    body: dict | None = None,
+    body: dict | BaseModel | None = None,
 ) -> dict:
-    base_url = _settings.orchestration_base_url.rstrip("/")
-    endpoint = f"{base_url}/{path.lstrip('/')}"
-    timeout_seconds = max(_settings.orchestration_timeout_seconds, 0.1)
-
-    payload = None
-    headers = {
-        "accept": "application/json",
-        "x-trace-id": trace_id,
-    }
-    if body is not None:
-        payload = json.dumps(body).encode("utf-8")
-        headers["content-type"] = "application/json"
-
-    request = url_request.Request(
-        url=endpoint,
-        data=payload,
+    return await _request_downstream(
+        service="orchestration",
+        label="Orchestration service",
+        code_prefix="ORCHESTRATION",
+        base_url=_settings.orchestration_base_url,
+        path=path,
         method=method,
-        headers=headers,
+        timeout_seconds=_settings.orchestration_timeout_seconds,
+        trace_id=trace_id,
+        body=body,
     )
 
-    try:
-        with url_request.urlopen(request, timeout=timeout_seconds) as response:
-            raw = response.read().decode("utf-8")
-    except url_error.HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="ignore")
-        if exc.code == 404:
-            raise ApiError(
-                status_code=404,
-                code="NOT_FOUND",
-                message="Automation incident not found.",
-                trace_id=trace_id,
-            ) from exc
-        if exc.code == 409:
-            raise ApiError(
-                status_code=409,
-                code="CONFLICT",
-                message=details[:180] or "Automation request conflict.",
-                trace_id=trace_id,
-            ) from exc
-        raise ApiError(
-            status_code=502,
-            code="ORCHESTRATION_ERROR",
-            message=f"Orchestration service HTTP {exc.code}: {details[:180]}",
-            trace_id=trace_id,
-        ) from exc
-    except url_error.URLError as exc:
-        raise ApiError(
-            status_code=503,
-            code="ORCHESTRATION_UNAVAILABLE",
-            message=f"Orchestration service unreachable: {exc.reason}",
-            trace_id=trace_id,
-        ) from exc
-    except (TimeoutError, socket.timeout) as exc:
-        raise ApiError(
-            status_code=504,
-            code="ORCHESTRATION_TIMEOUT",
-            message=f"Orchestration service timed out after {timeout_seconds:.1f}s.",
-            trace_id=trace_id,
-        ) from exc
-    except OSError as exc:
-        raise ApiError(
-            status_code=503,
-            code="ORCHESTRATION_UNAVAILABLE",
-            message=f"Orchestration network error: {exc}",
-            trace_id=trace_id,
-        ) from exc
-
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        raise ApiError(
-            status_code=502,
-            code="ORCHESTRATION_BAD_RESPONSE",
-            message="Orchestration service returned invalid JSON.",
-            trace_id=trace_id,
-        ) from exc
 
-    if not isinstance(parsed, dict):
-        raise ApiError(
-            status_code=502,
-            code="ORCHESTRATION_BAD_RESPONSE",
-            message="Orchestration service returned an unsupported payload shape.",
-            trace_id=trace_id,
-        )
-    return parsed
-
-
-def _request_report_generation(
+async def _request_report_generation(
     *,
     trace_id: str,
     method: str,
     path: str,
-    body: dict | None = None,
+    body: dict | BaseModel | None = None,
 ) -> dict:
-    base_url = _settings.report_generation_base_url.rstrip("/")
-    endpoint = f"{base_url}/{path.lstrip('/')}"
-    timeout_seconds = max(_settings.report_generation_timeout_seconds, 0.1)
-
-    payload = None
-    headers = {
-        "accept": "application/json",
-        "x-trace-id": trace_id,
-    }
-    if body is not None:
-        payload = json.dumps(body).encode("utf-8")
-        headers["content-type"] = "application/json"
-
-    request = url_request.Request(url=endpoint, data=payload, method=method, headers=headers)
-
-    try:
-        with url_request.urlopen(request, timeout=timeout_seconds) as response:
-            raw = response.read().decode("utf-8")
-    except url_error.HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="ignore")
-        if exc.code == 404:
-            raise ApiError(
-                status_code=404,
-                code="NOT_FOUND",
-                message="Requested evidence resource not found.",
-                trace_id=trace_id,
-            ) from exc
-        if exc.code == 409:
-            message = details[:180] or "Evidence request conflict."
-            if "EVIDENCE_REQUIRED" in details:
-                message = "EVIDENCE_REQUIRED"
+    def evidence_required(response: httpx.Response) -> None:
+        if response.status_code == 409 and response.content.find(b"EVIDENCE_REQUIRED", 0, _ERROR_BODY_LIMIT_BYTES) >= 0:
             raise ApiError(
                 status_code=409,
                 code="CONFLICT",
-                message=message,
-                trace_id=trace_id,
-            ) from exc
-        if exc.code in {400, 401, 403}:
-            raise ApiError(
-                status_code=exc.code,
-                code="BAD_REQUEST" if exc.code == 400 else "FORBIDDEN",
-                message=details[:180] or f"Report generation request failed with HTTP {exc.code}.",
+                message="EVIDENCE_REQUIRED",
                 trace_id=trace_id,
-            ) from exc
-        raise ApiError(
-            status_code=502,
-            code="REPORT_GENERATION_ERROR",
-            message=f"Report generation service HTTP {exc.code}: {details[:180]}",
-            trace_id=trace_id,
-        ) from exc
-    except url_error.URLError as exc:
-        raise ApiError(
-            status_code=503,
-            code="REPORT_GENERATION_UNAVAILABLE",
-            message=f"Report generation service unreachable: {exc.reason}",
-            trace_id=trace_id,
-        ) from exc
-    except (TimeoutError, socket.timeout) as exc:
-        raise ApiError(
-            status_code=504,
-            code="REPORT_GENERATION_TIMEOUT",
-            message=f"Report generation service timed out after {timeout_seconds:.1f}s.",
-            trace_id=trace_id,
-        ) from exc
-    except OSError as exc:
-        raise ApiError(
-            status_code=503,
-            code="REPORT_GENERATION_UNAVAILABLE",
-            message=f"Report generation network error: {exc}",
-            trace_id=trace_id,
-        ) from exc
-
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        raise ApiError(
-            status_code=502,
-            code="REPORT_GENERATION_BAD_RESPONSE",
-            message="Report generation service returned invalid JSON.",
-            trace_id=trace_id,
-        ) from exc
+            )
 
-    if not isinstance(parsed, dict):
-        raise ApiError(
-            status_code=502,
-            code="REPORT_GENERATION_BAD_RESPONSE",
-            message="Report generation service returned an unsupported payload shape.",
-            trace_id=trace_id,
-        )
-    return parsed
+    return await _request_downstream(
+        service="report_generation",
+        label="Report generation service",
+        code_prefix="REPORT_GENERATION",
+        base_url=_settings.report_generation_base_url,
+        path=path,
+        method=method,
+        timeout_seconds=_settings.report_generation_timeout_seconds,
+        trace_id=trace_id,
+        body=body,
+        check_error=evidence_required,
+    )
 
 
 def _parse_evidence_item(raw: dict, trace_id: str) -> EvidenceItem:
@@ -557,38 +596,61 @@ def _parse_evidence_item(raw: dict, trace_id: str) -> EvidenceItem:
         ) from exc
 
 
+def _parse_evidence_items(raw_items: list, trace_id: str) -> list[EvidenceItem]:
+    try:
+        return _EVIDENCE_LIST_ADAPTER.validate_python(raw_items)
+    except ValidationError as exc:
+        # Non-object entries are skipped rather than failing the whole list;
+        # filtering only happens on this rare path.
+        if all(isinstance(item, dict) for item in raw_items):
+            raise ApiError(
+                status_code=502,
+                code="REPORT_GENERATION_BAD_RESPONSE",
+                message=f"Evidence response validation failed: {exc.errors()}",
+                trace_id=trace_id,
+            ) from exc
+    return _parse_evidence_items([item for item in raw_items if isinstance(item, dict)], trace_id)
+
+
+# Store-backed routes are ``async`` as well: they never block, and a sync
+# ``def`` would be dispatched through the threadpool on every request.
 @router.get("/health", response_model=HealthCheckResponse)
-def health(request: Request) -> HealthCheckResponse:
+async def health(request: Request) -> HealthCheckResponse:
+    global _health_cache
+
     trace_id = _trace_id(request)
     _with_metrics("/health")
 
-    dependencies = {
-        "database": DependencyHealth(status="ok", latency_ms=6),
-        "event_stream": DependencyHealth(status="ok", latency_ms=4),
-        "blockchain_verifier": DependencyHealth(status="ok", latency_ms=7),
-    }
+    now = monotonic()
+    cached = _health_cache
+    if cached is None or cached[0] <= now:
+        cached = (
+            now + _HEALTH_CACHE_TTL_SECONDS,
+            HealthCheckResponse(
+                status="ok",
+                service=_settings.service_name,
+                version=_settings.service_version,
+                timestamp=datetime.now(tz=timezone.utc),
+                dependencies=_HEALTH_DEPENDENCIES,
+            ),
+        )
+        _health_cache = cached
 
     log_event(logger, "gateway_health", trace_id=trace_id)
-    return HealthCheckResponse(
-        status="ok",
-        service=_settings.service_name,
-        version=_settings.service_version,
-        timestamp=datetime.now(tz=timezone.utc),
-        dependencies=dependencies,
-    )
+    return cached[1]
 
 
 @router.get("/metrics", response_class=PlainTextResponse)
-def metrics() -> str:
+async def metrics() -> PlainTextResponse:
     if not _settings.metrics_enabled:
         raise ApiError(status_code=404, code="NOT_FOUND", message="metrics endpoint disabled")
-    return _metrics.render_prometheus()
+    return PlainTextResponse(content=_metrics.render_prometheus())
 
 
 @router.get("/assets", response_model=AssetListResponse)
-def list_assets(
+async def list_assets(
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=200),
     zone: str | None = Query(default=None),
@@ -596,15 +658,16 @@ def list_assets(
     status: str | None = Query(default=None),
 ) -> AssetListResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/assets")
 
-    items = _store.list_assets(zone=zone, asset_type=asset_type, status=status)
-    total_items = len(items)
+    page_items, total_items = _store.list_assets_page(
+        zone=zone,
+        asset_type=asset_type,
+        status=status,
+        offset=(page - 1) * page_size,
+        limit=page_size,
+    )
     total_pages = (total_items + page_size - 1) // page_size if total_items else 0
-    start = (page - 1) * page_size
-    end = start + page_size
-    page_items = items[start:end]
 
     log_event(logger, "gateway_assets_list", trace_id=trace_id, page=page, page_size=page_size)
     return AssetListResponse(
@@ -620,13 +683,12 @@ def list_assets(
 
 
 @router.post("/assets", response_model=AssetResponse, status_code=201)
-def create_asset(
+async def create_asset(
     request: Request,
     payload: CreateAssetRequest,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> AssetResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/assets:post")
 
     try:
@@ -639,71 +701,89 @@ def create_asset(
 
 
 @router.get("/assets/{asset_id}", response_model=AssetResponse)
-def get_asset(
+async def get_asset(
     asset_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
-) -> AssetResponse:
+    response: Response,
+    auth: Annotated[AuthContext, Depends(_authorized)],
+) -> AssetResponse | Response:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/assets/{asset_id}")
 
     asset = _store.get_asset(asset_id)
-    if asset is None:
+    etag = _store.asset_etag(asset_id)
+    if asset is None or etag is None:
         raise ApiError(status_code=404, code="NOT_FOUND", message="Resource not found.", trace_id=trace_id)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
+    response.headers["ETag"] = etag
     return AssetResponse(data=asset, meta=build_meta())
 
 
 @router.get("/assets/{asset_id}/health", response_model=AssetHealthResponse)
-def get_asset_health(
+async def get_asset_health(
     asset_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
-) -> AssetHealthResponse:
+    response: Response,
+    auth: Annotated[AuthContext, Depends(_authorized)],
+) -> AssetHealthResponse | Response:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/assets/{asset_id}/health")
 
     health = _store.get_asset_health(asset_id)
-    if health is None:
+    etag = _store.asset_etag(asset_id)
+    if health is None or etag is None:
         raise ApiError(status_code=404, code="NOT_FOUND", message="Resource not found.", trace_id=trace_id)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
+    response.headers["ETag"] = etag
     return AssetHealthResponse(data=health, meta=build_meta())
 
 
 @router.get("/assets/{asset_id}/forecast", response_model=AssetForecastResponse)
-def get_asset_forecast(
+async def get_asset_forecast(
     asset_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    response: Response,
+    auth: Annotated[AuthContext, Depends(_authorized)],
     horizon_hours: int = Query(default=72, ge=1, le=168),
-) -> AssetForecastResponse:
+) -> AssetForecastResponse | Response:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/assets/{asset_id}/forecast")
 
     forecast = _store.get_asset_forecast(asset_id, horizon_hours=horizon_hours)
-    if forecast is None:
+    etag = _store.asset_etag(asset_id, horizon_hours=horizon_hours)
+    if forecast is None or etag is None:
         raise ApiError(status_code=404, code="NOT_FOUND", message="Resource not found.", trace_id=trace_id)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
+    response.headers["ETag"] = etag
     return AssetForecastResponse(data=forecast, meta=build_meta())
 
 
 @router.get("/maintenance/{maintenance_id}/verification", response_model=MaintenanceVerificationResponse)
-def get_maintenance_verification(
+async def get_maintenance_verification(
     maintenance_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> MaintenanceVerificationResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/maintenance/{maintenance_id}/verification")
 
-    payload = _request_blockchain_verification(
+    payload = await _cached_read(
+        f"verification:{maintenance_id}",
+        _settings.downstream_read_cache_ttl_seconds,
+        partial(
+            _request_blockchain_verification,
+            trace_id=trace_id,
+            method="GET",
+            path=f"/verifications/{maintenance_id}",
+        ),
         trace_id=trace_id,
-        method="GET",
-        path=f"/verifications/{maintenance_id}",
+        bypass_cache=_bypass_read_cache(request),
     )
     verification = _parse_maintenance_verification(payload, trace_id)
     return MaintenanceVerificationResponse(data=verification, meta=build_meta())
@@ -713,21 +793,21 @@ def get_maintenance_verification(
     "/maintenance/{maintenance_id}/verification/track",
     response_model=MaintenanceVerificationTrackResponse,
 )
-def track_maintenance_verification(
+async def track_maintenance_verification(
     maintenance_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> MaintenanceVerificationTrackResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/maintenance/{maintenance_id}/verification/track")
 
-    payload = _request_blockchain_verification(
+    payload = await _request_blockchain_verification(
         trace_id=trace_id,
         method="POST",
         path=f"/verifications/{maintenance_id}/track",
         body={},
     )
+    _forget_reads(f"verification:{maintenance_id}")
 
     verification_payload = payload.get("verification")
     if not isinstance(verification_payload, dict):
@@ -759,18 +839,16 @@ def track_maintenance_verification(
     "/maintenance/{maintenance_id}/evidence/uploads",
     response_model=CreateEvidenceUploadResponse,
 )
-def create_maintenance_evidence_upload(
+async def create_maintenance_evidence_upload(
     maintenance_id: str,
     body: CreateEvidenceUploadRequest,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_require_organization)],
 ) -> CreateEvidenceUploadResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
-    require_roles(request, auth, "organization")
     _with_metrics("/maintenance/{maintenance_id}/evidence/uploads")
 
-    payload = _request_report_generation(
+    payload = await _request_report_generation(
         trace_id=trace_id,
         method="POST",
         path=f"/maintenance/{maintenance_id}/evidence/uploads",
@@ -779,6 +857,7 @@ def create_maintenance_evidence_upload(
             "uploaded_by": auth.subject,
         },
     )
+    _forget_reads(f"evidence:{maintenance_id}")
 
     evidence_raw = payload.get("evidence")
     if not isinstance(evidence_raw, dict):
@@ -832,24 +911,23 @@ def create_maintenance_evidence_upload(
     "/maintenance/{maintenance_id}/evidence/{evidence_id}/finalize",
     response_model=FinalizeEvidenceUploadResponse,
 )
-def finalize_maintenance_evidence_upload(
+async def finalize_maintenance_evidence_upload(
     maintenance_id: str,
     evidence_id: str,
     body: FinalizeEvidenceUploadRequest,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_require_organization)],
 ) -> FinalizeEvidenceUploadResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
-    require_roles(request, auth, "organization")
     _with_metrics("/maintenance/{maintenance_id}/evidence/{evidence_id}/finalize")
 
-    payload = _request_report_generation(
+    payload = await _request_report_generation(
         trace_id=trace_id,
         method="POST",
         path=f"/maintenance/{maintenance_id}/evidence/{evidence_id}/finalize",
-        body=body.model_dump(exclude_none=True),
+        body=body,
     )
+    _forget_reads(f"evidence:{maintenance_id}")
     evidence_raw = payload.get("evidence")
     if not isinstance(evidence_raw, dict):
         raise ApiError(
@@ -867,20 +945,25 @@ def finalize_maintenance_evidence_upload(
     "/maintenance/{maintenance_id}/evidence",
     response_model=EvidenceListResponse,
 )
-def list_maintenance_evidence(
+async def list_maintenance_evidence(
     maintenance_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_require_organization)],
 ) -> EvidenceListResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
-    require_roles(request, auth, "organization")
     _with_metrics("/maintenance/{maintenance_id}/evidence")
 
-    payload = _request_report_generation(
+    payload = await _cached_read(
+        f"evidence:{maintenance_id}",
+        _settings.downstream_read_cache_ttl_seconds,
+        partial(
+            _request_report_generation,
+            trace_id=trace_id,
+            method="GET",
+            path=f"/maintenance/{maintenance_id}/evidence",
+        ),
         trace_id=trace_id,
-        method="GET",
-        path=f"/maintenance/{maintenance_id}/evidence",
+        bypass_cache=_bypass_read_cache(request),
     )
     raw_items = payload.get("items")
     if not isinstance(raw_items, list):
@@ -891,7 +974,7 @@ def list_maintenance_evidence(
             trace_id=trace_id,
         )
 
-    items = [_parse_evidence_item(item, trace_id) for item in raw_items if isinstance(item, dict)]
+    items = _parse_evidence_items(raw_items, trace_id)
     return EvidenceListResponse(data=items, meta=build_meta())
 
 
@@ -899,26 +982,22 @@ def list_maintenance_evidence(
     "/maintenance/{maintenance_id}/verification/submit",
     response_model=VerificationSubmitResponse,
 )
-def submit_maintenance_verification(
+async def submit_maintenance_verification(
     maintenance_id: str,
     body: VerificationSubmitRequest,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_require_organization_or_operator)],
 ) -> VerificationSubmitResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
-    require_roles(request, auth, "organization", "operator")
     _with_metrics("/maintenance/{maintenance_id}/verification/submit")
 
-    payload = _request_orchestration(
+    payload = await _request_orchestration(
         trace_id=trace_id,
         method="POST",
         path=f"/maintenance/{maintenance_id}/verification/submit",
-        body={
-            **body.model_dump(exclude_none=True),
-            "submitted_by": body.submitted_by or auth.subject,
-        },
+        body=body if body.submitted_by else body.model_copy(update={"submitted_by": auth.subject}),
     )
+    _forget_reads(f"verification:{maintenance_id}")
     try:
         result = VerificationSubmitResult.model_validate(payload)
     except ValidationError as exc:
@@ -933,15 +1012,14 @@ def submit_maintenance_verification(
 
 
 @router.post("/blockchain/connect", response_model=BlockchainConnectResponse)
-def connect_blockchain(
+async def connect_blockchain(
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> BlockchainConnectResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/blockchain/connect")
 
-    payload = _connect_blockchain_service(trace_id)
+    payload = await _connect_blockchain_service(trace_id)
     payload["source"] = "services/blockchain-verification-service"
 
     try:
@@ -968,16 +1046,21 @@ def connect_blockchain(
 
 
 @router.get("/telemetry/{asset_id}/latest", response_model=AssetTelemetryResponse)
-def get_latest_telemetry(
+async def get_latest_telemetry(
     asset_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> AssetTelemetryResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/telemetry/{asset_id}/latest")
 
-    payload = _fetch_sensor_telemetry(asset_id, trace_id)
+    payload = await _cached_read(
+        f"telemetry:{asset_id}",
+        _settings.sensor_telemetry_cache_ttl_seconds,
+        partial(_fetch_sensor_telemetry, asset_id, trace_id),
+        trace_id=trace_id,
+        bypass_cache=_bypass_read_cache(request),
+    )
 
     try:
         telemetry = AssetTelemetry.model_validate(payload)
@@ -1001,15 +1084,14 @@ def get_latest_telemetry(
 
 
 @router.get("/automation/incidents", response_model=AutomationIncidentListResponse)
-def list_automation_incidents(
+async def list_automation_incidents(
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> AutomationIncidentListResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/automation/incidents")
 
-    payload = _request_orchestration(trace_id=trace_id, method="GET", path="/incidents")
+    payload = await _request_orchestration(trace_id=trace_id, method="GET", path="/incidents")
     raw_items = payload.get("items")
     if not isinstance(raw_items, list):
         raise ApiError(
@@ -1020,7 +1102,7 @@ def list_automation_incidents(
         )
 
     try:
-        items = [AutomationIncident.model_validate(item) for item in raw_items]
+        items = _INCIDENT_LIST_ADAPTER.validate_python(raw_items)
     except ValidationError as exc:
         raise ApiError(
             status_code=502,
@@ -1032,16 +1114,15 @@ def list_automation_incidents(
 
 
 @router.get("/automation/incidents/{workflow_id}", response_model=AutomationIncidentResponse)
-def get_automation_incident(
+async def get_automation_incident(
     workflow_id: str,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> AutomationIncidentResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/automation/incidents/{workflow_id}")
 
-    payload = _request_orchestration(
+    payload = await _request_orchestration(
         trace_id=trace_id,
         method="GET",
         path=f"/incidents/{workflow_id}",
@@ -1062,21 +1143,20 @@ def get_automation_incident(
     "/automation/incidents/{workflow_id}/acknowledge",
     response_model=AutomationAcknowledgeResponse,
 )
-def acknowledge_automation_incident(
+async def acknowledge_automation_incident(
     workflow_id: str,
     body: AutomationAcknowledgeRequest,
     request: Request,
-    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    auth: Annotated[AuthContext, Depends(_authorized)],
 ) -> AutomationAcknowledgeResponse:
     trace_id = _trace_id(request)
-    enforce_rate_limit(request, auth)
     _with_metrics("/automation/incidents/{workflow_id}/acknowledge")
 
-    payload = _request_orchestration(
+    payload = await _request_orchestration(
         trace_id=trace_id,
         method="POST",
         path=f"/incidents/{workflow_id}/acknowledge",
-        body=body.model_dump(exclude_none=True),
+        body=body,
     )
     try:
         acknowledgement = AutomationAcknowledgeResult.model_validate(payload)
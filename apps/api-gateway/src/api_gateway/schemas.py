@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 AssetType = Literal["bridge", "road", "tunnel", "flyover", "other"]
@@ -50,6 +50,8 @@ class ErrorResponse(BaseModel):
 class DependencyHealth(BaseModel):
     """Health details for one dependency."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: Literal["ok", "degraded", "down"]
     latency_ms: int | None = Field(default=None, ge=0)
 
@@ -203,6 +205,12 @@ class MaintenanceVerification(BaseModel):
     trace_id: str | None = None
     verified_at: datetime | None = None
 
+    @model_validator(mode="after")
+    def _default_verified_at(self) -> "MaintenanceVerification":
+        if self.verified_at is None and self.confirmed_at is not None:
+            self.verified_at = self.confirmed_at
+        return self
+
 
 class MaintenanceVerificationResponse(BaseModel):
     """Verification response wrapper."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from threading import Lock
 from time import time
@@ -55,6 +56,7 @@ class InMemoryRateLimiter:
 
 
 _settings = get_settings()
+_DEFAULT_ROLES = frozenset({"operator"})
 _rate_limiter = InMemoryRateLimiter(
     limit=max(_settings.rate_limit_requests, 1),
     window_seconds=max(_settings.rate_limit_window_seconds, 1),
@@ -92,18 +94,16 @@ def get_auth_context(request: Request) -> AuthContext:
             trace_id=request.headers.get("x-trace-id"),
         )
 
-    roles = settings.token_roles.get(token, frozenset({"operator"}))
-    return AuthContext(subject="gateway-client", token=token, roles=frozenset(roles))
+    roles = settings.token_roles.get(token, _DEFAULT_ROLES)
+    return AuthContext(subject="gateway-client", token=token, roles=roles)
 
 
-def require_roles(request: Request, auth: AuthContext, *allowed_roles: str) -> None:
-    """Validate caller roles for sensitive routes."""
+def _normalize_roles(allowed_roles: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(role.strip().lower() for role in allowed_roles if role.strip())
 
-    normalized = {role.strip().lower() for role in allowed_roles if role.strip()}
-    if not normalized:
-        return
 
-    if auth.roles.intersection(normalized):
+def _check_roles(request: Request, auth: AuthContext, normalized: frozenset[str]) -> None:
+    if not normalized or not auth.roles.isdisjoint(normalized):
         return
 
     raise ApiError(
@@ -114,6 +114,26 @@ def require_roles(request: Request, auth: AuthContext, *allowed_roles: str) -> N
     )
 
 
+def role_guard(*allowed_roles: str) -> Callable[[Request], Awaitable[AuthContext]]:
+    """Build a route dependency that authenticates, rate-limits and checks roles.
+
+    Roles are normalized once when the guard is built, and a rejected caller
+    fails during dependency resolution before the handler body runs. The guard
+    is ``async`` so FastAPI resolves it on the event loop instead of sending
+    it through the threadpool like a sync dependency.
+    """
+
+    normalized = _normalize_roles(allowed_roles)
+
+    async def guard(request: Request) -> AuthContext:
+        auth = get_auth_context(request)
+        enforce_rate_limit(request, auth)
+        _check_roles(request, auth, normalized)
+        return auth
+
+    return guard
+
+
 def enforce_rate_limit(request: Request, auth: AuthContext | None = None) -> None:
     """Enforce per-caller request rate limit."""
 
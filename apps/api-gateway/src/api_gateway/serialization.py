@@ -0,0 +1,56 @@
+"""JSON encoding helpers for API gateway, backed by orjson when installed."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from enum import Enum
+import json
+from typing import Any, Callable
+from uuid import UUID
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _stdlib_default(default: Callable[[Any], Any] | None, value: Any) -> Any:
+    # Mirror the types orjson encodes natively so both backends emit the same bytes.
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if default is None:
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+    return default(value)
+
+
+def dumps(value: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize ``value`` to compact UTF-8 JSON bytes.
+
+    Both backends coerce non-string dict keys, encode datetimes as ISO 8601
+    and leave non-ASCII text unescaped.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        value,
+        default=lambda item: _stdlib_default(default, item),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse JSON from bytes or text.
+
+    Raises ``json.JSONDecodeError`` on invalid input; ``orjson.JSONDecodeError``
+    subclasses it, so callers handle both backends the same way.
+    """
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from threading import Lock
+from time import time_ns
 
 from .schemas import Asset, AssetForecast, AssetHealth, CreateAssetRequest, MaintenanceVerification
 
@@ -123,6 +124,11 @@ class InMemoryGatewayStore:
                 forecasts={forecast_1.asset_id: forecast_1, forecast_2.asset_id: forecast_2},
                 verifications={verification.maintenance_id: verification},
             )
+            self._sorted_asset_cache: list[Asset] | None = None
+            # Validators change whenever the seeded data is rebuilt, so stale
+            # client caches from before a reset or restart never match.
+            self._epoch = time_ns()
+            self._asset_versions = {asset_id: 1 for asset_id in self._snapshot.assets}
 
     def list_assets(
         self,
@@ -132,16 +138,40 @@ class InMemoryGatewayStore:
         status: str | None,
     ) -> list[Asset]:
         with self._lock:
-            items = list(self._snapshot.assets.values())
+            items = self._sorted_assets()
 
-        if zone:
-            items = [item for item in items if item.zone == zone]
-        if asset_type:
-            items = [item for item in items if item.asset_type == asset_type]
-        if status:
-            items = [item for item in items if item.status == status]
+        return [
+            item
+            for item in items
+            if (not zone or item.zone == zone)
+            and (not asset_type or item.asset_type == asset_type)
+            and (not status or item.status == status)
+        ]
 
-        return sorted(items, key=lambda item: item.asset_id)
+    def list_assets_page(
+        self,
+        *,
+        zone: str | None,
+        asset_type: str | None,
+        status: str | None,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[Asset], int]:
+        """Return one page of filtered assets ordered by id and the filtered total."""
+
+        if not (zone or asset_type or status):
+            with self._lock:
+                items = self._sorted_assets()
+            return items[offset : offset + limit], len(items)
+
+        items = self.list_assets(zone=zone, asset_type=asset_type, status=status)
+        return items[offset : offset + limit], len(items)
+
+    def _sorted_assets(self) -> list[Asset]:
+        # Caller holds the lock. The ordered view is rebuilt only after writes.
+        if self._sorted_asset_cache is None:
+            self._sorted_asset_cache = sorted(self._snapshot.assets.values(), key=lambda item: item.asset_id)
+        return self._sorted_asset_cache
 
     def create_asset(self, payload: CreateAssetRequest) -> Asset:
         now = datetime.now(tz=timezone.utc)
@@ -161,12 +191,29 @@ class InMemoryGatewayStore:
                 updated_at=now,
             )
             self._snapshot.assets[asset.asset_id] = asset
+            self._sorted_asset_cache = None
+            self._asset_versions[asset.asset_id] = self._asset_versions.get(asset.asset_id, 0) + 1
             return asset
 
     def get_asset(self, asset_id: str) -> Asset | None:
         with self._lock:
             return self._snapshot.assets.get(asset_id)
 
+    def asset_etag(self, asset_id: str, *, horizon_hours: int | None = None) -> str | None:
+        """Return a weak validator for the asset's current version, if it exists.
+
+        Forecast reads pass ``horizon_hours`` so each horizon gets its own validator.
+        """
+
+        with self._lock:
+            version = self._asset_versions.get(asset_id)
+            epoch = self._epoch
+        if version is None:
+            return None
+        if horizon_hours is not None:
+            return f'W/"{epoch:x}.{version:x}.{horizon_hours}"'
+        return f'W/"{epoch:x}.{version:x}"'
+
     def get_asset_health(self, asset_id: str) -> AssetHealth | None:
         with self._lock:
             return self._snapshot.health.get(asset_id)
@@ -1,20 +1,31 @@
 """Tests for API gateway."""
 
+import asyncio
+from datetime import datetime, timezone
+import inspect
 import json
+import logging
 from pathlib import Path
 import sys
 from uuid import uuid4
 
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
+import httpx
+from pydantic import BaseModel
 import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT / "src"))
 
+from api_gateway.circuit_breaker import get_circuit_breakers  # noqa: E402
+from api_gateway.config import Settings, get_settings  # noqa: E402
 from api_gateway.main import app  # noqa: E402
 from api_gateway.observability import get_metrics  # noqa: E402
-from api_gateway.errors import ApiError  # noqa: E402
+from api_gateway.errors import ApiError, error_response  # noqa: E402
+from api_gateway import observability, serialization  # noqa: E402
 from api_gateway import routes as gateway_routes  # noqa: E402
+from api_gateway.schemas import AutomationAcknowledgeRequest  # noqa: E402
 from api_gateway.security import get_rate_limiter  # noqa: E402
 from api_gateway.store import get_store  # noqa: E402
 
@@ -26,6 +37,10 @@ AUTH_HEADERS = {"Authorization": "Bearer dev-token", "x-trace-id": "trc_test_gat
 def reset_state() -> None:
     get_store().reset()
     get_metrics().reset()
+    gateway_routes._read_cache.clear()
+    gateway_routes._read_inflight.clear()
+    gateway_routes._health_cache = None
+    get_circuit_breakers().reset()
     limiter = get_rate_limiter()
     limiter.set_limits(limit=60, window_seconds=60)
 
@@ -37,6 +52,7 @@ def test_health_is_public() -> None:
     body = response.json()
     assert body["service"] == "api-gateway"
     assert body["status"] == "ok"
+    assert client.get("/health").json()["timestamp"] == body["timestamp"]
 
 
 def test_assets_requires_auth() -> None:
@@ -52,6 +68,8 @@ def test_asset_list_and_create_flow() -> None:
     listed = client.get("/assets", headers=AUTH_HEADERS)
     assert listed.status_code == 200
     assert len(listed.json()["data"]) >= 1
+    relisted = client.get("/assets", headers=AUTH_HEADERS)
+    assert relisted.json()["meta"]["request_id"] != listed.json()["meta"]["request_id"]
 
     created = client.post(
         "/assets",
@@ -73,6 +91,56 @@ def test_asset_list_and_create_flow() -> None:
     assert fetched.status_code == 200
     assert fetched.json()["data"]["name"] == "West Sector Bridge 901"
 
+    paged = client.get("/assets", headers=AUTH_HEADERS, params={"page": 2, "page_size": 2})
+    assert paged.status_code == 200
+    assert [item["asset_id"] for item in paged.json()["data"]] == ["asset_w15_bridge_0901"]
+    assert paged.json()["pagination"]["total_items"] == 3
+    assert paged.json()["pagination"]["total_pages"] == 2
+
+
+def test_asset_reads_honor_if_none_match() -> None:
+    client = TestClient(app)
+
+    for path in (
+        "/assets/asset_w12_bridge_0042",
+        "/assets/asset_w12_bridge_0042/health",
+        "/assets/asset_w12_bridge_0042/forecast",
+    ):
+        first = client.get(path, headers=AUTH_HEADERS)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        cached = client.get(path, headers={**AUTH_HEADERS, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+    stale = client.get(
+        "/assets/asset_w12_bridge_0042",
+        headers={**AUTH_HEADERS, "If-None-Match": 'W/"0.0"'},
+    )
+    assert stale.status_code == 200
+
+    forecast_etag = client.get("/assets/asset_w12_bridge_0042/forecast", headers=AUTH_HEADERS).headers["etag"]
+    other_horizon = client.get(
+        "/assets/asset_w12_bridge_0042/forecast",
+        headers={**AUTH_HEADERS, "If-None-Match": forecast_etag},
+        params={"horizon_hours": 24},
+    )
+    assert other_horizon.status_code == 200
+    assert other_horizon.headers["etag"] != forecast_etag
+
+
+def test_validation_errors_use_error_envelope() -> None:
+    client = TestClient(app)
+
+    response = client.get("/assets", headers=AUTH_HEADERS, params={"page": 0})
+    assert response.status_code == 422
+    error = response.json()["error"]
+    assert error["code"] == "UNPROCESSABLE_ENTITY"
+    assert error["trace_id"] == "trc_test_gateway_001"
+    assert [detail["field"] for detail in error["details"]] == ["query.page"]
+
 
 def test_health_forecast_and_verification_endpoints(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
@@ -89,7 +157,7 @@ def test_health_forecast_and_verification_endpoints(monkeypatch: pytest.MonkeyPa
     assert forecast.status_code == 200
     assert forecast.json()["data"]["horizon_hours"] == 48
 
-    def fake_verification_request(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_verification_request(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
         del trace_id, body
         assert method == "GET"
         assert path == "/verifications/mnt_20260214_0012"
@@ -123,6 +191,7 @@ def test_health_forecast_and_verification_endpoints(monkeypatch: pytest.MonkeyPa
     assert verification.status_code == 200
     assert verification.json()["data"]["verification_status"] == "confirmed"
     assert verification.json()["data"]["confirmations"] == 3
+    assert verification.json()["data"]["verified_at"] == verification.json()["data"]["confirmed_at"]
 
 
 def test_rate_limit_enforced() -> None:
@@ -143,10 +212,87 @@ def test_rate_limit_enforced() -> None:
     assert "infraguard_api_gateway_rate_limited_total 1" in metrics.text
 
 
+def test_metrics_count_requests_per_path() -> None:
+    client = TestClient(app)
+
+    assert client.get("/health").status_code == 200
+    assert client.get("/health").status_code == 200
+    assert client.get("/assets", headers=AUTH_HEADERS).status_code == 200
+    assert client.get("/assets/asset_missing_0000_1", headers=AUTH_HEADERS).status_code == 404
+
+    metrics = client.get("/metrics")
+    assert metrics.status_code == 200
+    assert "infraguard_api_gateway_requests_total 4" in metrics.text
+    assert "infraguard_api_gateway_errors_total 1" in metrics.text
+    assert 'infraguard_api_gateway_requests_path_total{path="health"} 2' in metrics.text
+    assert 'infraguard_api_gateway_requests_path_total{path="assets"} 1' in metrics.text
+    assert 'infraguard_api_gateway_requests_path_total{path="assets_{asset_id}"} 1' in metrics.text
+
+
+def test_metric_recorders_only_run_on_the_event_loop() -> None:
+    # GatewayMetrics counters are lock-free, which is only safe while no
+    # route, dependency or exception handler is dispatched to the threadpool.
+    def calls(dependant) -> list:
+        found = [dependant.call]
+        for dependency in dependant.dependencies:
+            found.extend(calls(dependency))
+        return found
+
+    api_routes = [route for route in [*app.routes, *gateway_routes.router.routes] if isinstance(route, APIRoute)]
+    assert api_routes
+    for route in api_routes:
+        for call in calls(route.dependant):
+            assert inspect.iscoroutinefunction(call), f"{route.path}: {call.__name__} is not async"
+    for handler in app.exception_handlers.values():
+        assert inspect.iscoroutinefunction(handler), f"{handler.__name__} is not async"
+
+
+def test_json_backends_encode_log_and_error_payloads_identically(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    pytest.importorskip("orjson")
+    frozen = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(observability, "_now", lambda _tz: frozen)
+    logger = logging.getLogger("api_gateway.tests.serialization")
+    request_id = uuid4()
+
+    def encode() -> tuple[str, bytes]:
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            observability.log_event(
+                logger,
+                "asset_seen",
+                asset_name="Pont Neuf – Süd",
+                observed_at=datetime(2026, 2, 14, 12, 30, 15),
+                request_id=request_id,
+                counts={1: 2, "zone": "w12"},
+                source=Path("/tmp/asset.json"),
+            )
+        response = error_response(
+            status_code=409,
+            code="CONFLICT",
+            message="Brücke bereits geprüft",
+            trace_id="trc_test_gateway_001",
+            details=[{"field": "body.asset_id", "message": "déjà vu"}],
+        )
+        return caplog.records[-1].getMessage(), response.body
+
+    native = encode()
+    monkeypatch.setattr(serialization, "orjson", None)
+    fallback = encode()
+
+    assert fallback == native
+    assert '"observed_at":"2026-02-14T12:30:15"' in native[0]
+    assert '"counts":{"1":2,"zone":"w12"}' in native[0]
+    assert "Pont Neuf – Süd" in native[0]
+    assert "Brücke" in native[1].decode("utf-8")
+
+
 def test_blockchain_connect_proxies_sepolia_status(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_connect(_trace_id: str) -> dict:
+    async def fake_connect(_trace_id: str) -> dict:
         return {
             "connected": True,
             "network": "sepolia",
@@ -173,7 +319,7 @@ def test_blockchain_connect_proxies_sepolia_status(monkeypatch: pytest.MonkeyPat
 def test_blockchain_connect_returns_error_when_service_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_connect(_trace_id: str) -> dict:
+    async def fake_connect(_trace_id: str) -> dict:
         raise ApiError(
             status_code=503,
             code="BLOCKCHAIN_UNAVAILABLE",
@@ -192,7 +338,7 @@ def test_blockchain_connect_returns_error_when_service_unavailable(monkeypatch:
 def test_blockchain_connect_maps_timeout_to_504(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_connect(_trace_id: str) -> dict:
+    async def fake_connect(_trace_id: str) -> dict:
         raise ApiError(
             status_code=504,
             code="BLOCKCHAIN_TIMEOUT",
@@ -208,17 +354,35 @@ def test_blockchain_connect_maps_timeout_to_504(monkeypatch: pytest.MonkeyPatch)
     assert body["error"]["code"] == "BLOCKCHAIN_TIMEOUT"
 
 
+def test_settings_canonicalize_downstream_urls_and_timeouts() -> None:
+    settings = Settings(
+        orchestration_base_url="http://127.0.0.1:8200/",
+        blockchain_verification_base_url="http://127.0.0.1:8105/",
+        blockchain_verification_fallback_urls_csv="http://127.0.0.1:8235/, http://127.0.0.1:8105",
+        orchestration_timeout_seconds=0,
+    )
+
+    assert settings.orchestration_base_url == "http://127.0.0.1:8200"
+    assert settings.blockchain_verification_urls == ["http://127.0.0.1:8105", "http://127.0.0.1:8235"]
+    assert settings.orchestration_timeout_seconds == 0.1
+
+
+def _mock_http_client(monkeypatch: pytest.MonkeyPatch, handler) -> None:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(gateway_routes, "get_http_client", lambda: client)
+
+
 def test_connect_blockchain_service_timeout_raises_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_urlopen(*_args, **_kwargs):
-        raise TimeoutError("timed out")
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
 
-    monkeypatch.setattr(gateway_routes.url_request, "urlopen", fake_urlopen)
+    _mock_http_client(monkeypatch, handler)
 
     previous_timeout = gateway_routes._settings.blockchain_connect_timeout_seconds
     gateway_routes._settings.blockchain_connect_timeout_seconds = 1.5
     try:
         with pytest.raises(ApiError) as exc_info:
-            gateway_routes._connect_blockchain_service("trc_test_gateway_001")
+            asyncio.run(gateway_routes._connect_blockchain_service("trc_test_gateway_001"))
     finally:
         gateway_routes._settings.blockchain_connect_timeout_seconds = previous_timeout
 
@@ -239,68 +403,256 @@ def test_connect_blockchain_service_uses_fallback_url(monkeypatch: pytest.Monkey
         "message": "Connected to Sepolia RPC.",
     }
 
-    class FakeResponse:
-        def __init__(self, body: str) -> None:
-            self._body = body
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url).startswith("http://127.0.0.1:8105"):
+            raise httpx.ConnectError("[Errno 61] Connection refused", request=request)
+        return httpx.Response(200, json=payload)
+
+    _mock_http_client(monkeypatch, handler)
+    monkeypatch.setattr(
+        gateway_routes,
+        "_settings",
+        Settings(
+            blockchain_verification_base_url="http://127.0.0.1:8105",
+            blockchain_verification_fallback_urls_csv="http://127.0.0.1:8235",
+        ),
+    )
 
-        def __enter__(self) -> "FakeResponse":
-            return self
+    result = asyncio.run(gateway_routes._connect_blockchain_service("trc_test_gateway_001"))
 
-        def __exit__(self, *_args: object) -> None:
-            return None
+    assert result["connected"] is True
+    assert result["chain_id"] == 11155111
 
-        def read(self) -> bytes:
-            return self._body.encode("utf-8")
 
-    def fake_urlopen(request: object, timeout: float):  # noqa: ARG001
-        url = getattr(request, "full_url")
-        if url.startswith("http://127.0.0.1:8105"):
-            raise gateway_routes.url_error.URLError("[Errno 61] Connection refused")
-        return FakeResponse(json.dumps(payload))
+def test_connect_blockchain_service_unavailable_includes_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError(f"refused for {request.url}", request=request)
+
+    _mock_http_client(monkeypatch, handler)
+    monkeypatch.setattr(
+        gateway_routes,
+        "_settings",
+        Settings(
+            blockchain_verification_base_url="http://127.0.0.1:8105",
+            blockchain_verification_fallback_urls_csv="http://127.0.0.1:8235",
+        ),
+    )
 
-    monkeypatch.setattr(gateway_routes.url_request, "urlopen", fake_urlopen)
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(gateway_routes._connect_blockchain_service("trc_test_gateway_001"))
 
-    previous_base = gateway_routes._settings.blockchain_verification_base_url
-    previous_fallbacks = gateway_routes._settings.blockchain_verification_fallback_urls_csv
-    gateway_routes._settings.blockchain_verification_base_url = "http://127.0.0.1:8105"
-    gateway_routes._settings.blockchain_verification_fallback_urls_csv = "http://127.0.0.1:8235"
-    try:
-        result = gateway_routes._connect_blockchain_service("trc_test_gateway_001")
-    finally:
-        gateway_routes._settings.blockchain_verification_base_url = previous_base
-        gateway_routes._settings.blockchain_verification_fallback_urls_csv = previous_fallbacks
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.code == "BLOCKCHAIN_UNAVAILABLE"
+    assert "Tried:" in exc_info.value.message
 
-    assert result["connected"] is True
-    assert result["chain_id"] == 11155111
 
+def test_request_blockchain_verification_hedges_to_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.port == 8105:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"port": request.url.port})
+
+    _mock_http_client(monkeypatch, handler)
+    monkeypatch.setattr(
+        gateway_routes,
+        "_settings",
+        Settings(
+            blockchain_verification_base_url="http://127.0.0.1:8105",
+            blockchain_verification_fallback_urls_csv="http://127.0.0.1:8235",
+            blockchain_hedge_delay_seconds=0.01,
+        ),
+    )
 
-def test_connect_blockchain_service_unavailable_includes_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_urlopen(request: object, timeout: float):  # noqa: ARG001
-        url = getattr(request, "full_url")
-        raise gateway_routes.url_error.URLError(f"refused for {url}")
+    result = asyncio.run(
+        gateway_routes._request_blockchain_verification(
+            trace_id="trc_test_gateway_001",
+            method="GET",
+            path="/verifications/mnt_20260214_0012",
+        )
+    )
 
-    monkeypatch.setattr(gateway_routes.url_request, "urlopen", fake_urlopen)
+    assert result == {"port": 8235}
 
-    previous_base = gateway_routes._settings.blockchain_verification_base_url
-    previous_fallbacks = gateway_routes._settings.blockchain_verification_fallback_urls_csv
-    gateway_routes._settings.blockchain_verification_base_url = "http://127.0.0.1:8105"
-    gateway_routes._settings.blockchain_verification_fallback_urls_csv = "http://127.0.0.1:8235"
-    try:
+
+def test_request_blockchain_verification_does_not_hedge_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, int]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.port))
+        if request.url.port == 8105:
+            await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"port": request.url.port})
+
+    _mock_http_client(monkeypatch, handler)
+    monkeypatch.setattr(
+        gateway_routes,
+        "_settings",
+        Settings(
+            blockchain_verification_base_url="http://127.0.0.1:8105",
+            blockchain_verification_fallback_urls_csv="http://127.0.0.1:8235",
+            blockchain_hedge_delay_seconds=0.01,
+        ),
+    )
+
+    result = asyncio.run(
+        gateway_routes._request_blockchain_verification(
+            trace_id="trc_test_gateway_001",
+            method="POST",
+            path="/verifications/mnt_20260214_0012/track",
+            body={},
+        )
+    )
+
+    assert result == {"port": 8105}
+    assert calls == [("POST", 8105)]
+
+
+def test_request_blockchain_verification_fails_over_writes_on_unmapped_status(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[str, int]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.port))
+        if request.url.port == 8105:
+            return httpx.Response(429, json={"detail": "slow down"})
+        return httpx.Response(200, json={"port": request.url.port})
+
+    _mock_http_client(monkeypatch, handler)
+    monkeypatch.setattr(
+        gateway_routes,
+        "_settings",
+        Settings(
+            blockchain_verification_base_url="http://127.0.0.1:8105",
+            blockchain_verification_fallback_urls_csv="http://127.0.0.1:8235",
+            blockchain_hedge_delay_seconds=0.01,
+        ),
+    )
+
+    result = asyncio.run(
+        gateway_routes._request_blockchain_verification(
+            trace_id="trc_test_gateway_001",
+            method="POST",
+            path="/verifications/mnt_20260214_0012/track",
+            body={},
+        )
+    )
+
+    assert result == {"port": 8235}
+    assert calls == [("POST", 8105), ("POST", 8235)]
+
+
+def test_first_result_prefers_success_over_error_in_same_round() -> None:
+    async def race() -> dict | None:
+        # Both attempts wait on one event, so they finish in the same round.
+        release = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.02, release.set)
+
+        async def attempt(base_url: str) -> dict | None:
+            await release.wait()
+            if base_url == "fail":
+                raise ApiError(status_code=404, code="NOT_FOUND", message="missing")
+            return {"url": base_url}
+
+        return await gateway_routes._first_result(attempt, ["fail", "ok"], 0)
+
+    assert asyncio.run(race()) == {"url": "ok"}
+
+
+def test_request_orchestration_fails_fast_once_circuit_opens(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    _mock_http_client(monkeypatch, handler)
+    threshold = get_settings().downstream_breaker_failure_threshold
+
+    for _ in range(threshold + 2):
         with pytest.raises(ApiError) as exc_info:
-            gateway_routes._connect_blockchain_service("trc_test_gateway_001")
-    finally:
-        gateway_routes._settings.blockchain_verification_base_url = previous_base
-        gateway_routes._settings.blockchain_verification_fallback_urls_csv = previous_fallbacks
+            asyncio.run(
+                gateway_routes._request_orchestration(
+                    trace_id="trc_test_gateway_001",
+                    method="GET",
+                    path="/incidents",
+                )
+            )
+        assert exc_info.value.code == "ORCHESTRATION_UNAVAILABLE"
+
+    assert calls == threshold
+    assert "circuit open" in exc_info.value.message
+
+
+def test_report_generation_error_details_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, content=b"x" * 1_000_000)
+
+    _mock_http_client(monkeypatch, handler)
+
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(
+            gateway_routes._request_report_generation(
+                trace_id="trc_test_gateway_001",
+                method="GET",
+                path="/maintenance/mnt_20260214_0012/evidence",
+            )
+        )
 
-    assert exc_info.value.status_code == 503
-    assert exc_info.value.code == "BLOCKCHAIN_UNAVAILABLE"
-    assert "Tried:" in exc_info.value.message
+    assert exc_info.value.status_code == 502
+    assert exc_info.value.message == "Report generation service HTTP 500: " + "x" * 180
+
+
+def test_report_generation_maps_evidence_required_conflict(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(409, json={"detail": "EVIDENCE_REQUIRED: upload evidence first"})
+
+    _mock_http_client(monkeypatch, handler)
+
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(
+            gateway_routes._request_report_generation(
+                trace_id="trc_test_gateway_001",
+                method="POST",
+                path="/maintenance/mnt_20260214_0012/verification/submit",
+                body={},
+            )
+        )
+
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.message == "EVIDENCE_REQUIRED"
+
+
+def test_request_orchestration_maps_conflict(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.url.path == "/incidents/wf_20260214_120001_0001/acknowledge"
+        assert request.headers["x-trace-id"] == "trc_test_gateway_001"
+        assert json.loads(request.content) == {"acknowledged_by": "ops-chief-01"}
+        return httpx.Response(409, text="already acknowledged")
+
+    _mock_http_client(monkeypatch, handler)
+
+    with pytest.raises(ApiError) as exc_info:
+        asyncio.run(
+            gateway_routes._request_orchestration(
+                trace_id="trc_test_gateway_001",
+                method="POST",
+                path="/incidents/wf_20260214_120001_0001/acknowledge",
+                body=AutomationAcknowledgeRequest(acknowledged_by="ops-chief-01"),
+            )
+        )
+
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.code == "CONFLICT"
+    assert exc_info.value.message == "already acknowledged"
 
 
 def test_asset_telemetry_proxies_sensor_ingestion(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_fetch(asset_id: str, _trace_id: str) -> dict:
+    async def fake_fetch(asset_id: str, _trace_id: str) -> dict:
         assert asset_id == "asset_w12_bridge_0042"
         return {
             "asset_id": asset_id,
@@ -353,10 +705,82 @@ def test_asset_telemetry_proxies_sensor_ingestion(monkeypatch: pytest.MonkeyPatc
     assert body["data"]["computed"]["health_proxy_score"] == 0.77
 
 
+def test_asset_telemetry_reuses_recent_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    calls: list[str] = []
+
+    async def fake_fetch(asset_id: str, trace_id: str) -> dict:
+        calls.append(trace_id)
+        return {
+            "asset_id": asset_id,
+            "source": "firebase",
+            "captured_at": "2026-02-14T12:00:00+00:00",
+            "sensors": {},
+            "computed": {
+                "acceleration_magnitude_g": 1.01,
+                "vibration_rms_ms2": 1.2,
+                "tilt_deg": 3.5,
+                "strain_proxy_microstrain": 13.5,
+                "thermal_stress_index": 0.38,
+                "fatigue_index": 0.19,
+                "health_proxy_score": 0.77,
+            },
+        }
+
+    monkeypatch.setattr(gateway_routes, "_fetch_sensor_telemetry", fake_fetch)
+
+    for _ in range(2):
+        response = client.get("/telemetry/asset_w12_bridge_0042/latest", headers=AUTH_HEADERS)
+        assert response.status_code == 200
+    assert len(calls) == 1
+
+    bypass = client.get(
+        "/telemetry/asset_w12_bridge_0042/latest",
+        headers={**AUTH_HEADERS, "Cache-Control": "no-store"},
+    )
+    assert bypass.status_code == 200
+    assert len(calls) == 2
+
+
+def test_coalesced_telemetry_errors_keep_each_caller_trace_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def fake_fetch(asset_id: str, trace_id: str) -> dict:
+        calls.append(trace_id)
+        await asyncio.sleep(0.02)
+        raise ApiError(
+            status_code=503,
+            code="SENSOR_INGESTION_UNAVAILABLE",
+            message="Sensor ingestion service unreachable",
+            trace_id=trace_id,
+        )
+
+    monkeypatch.setattr(gateway_routes, "_fetch_sensor_telemetry", fake_fetch)
+
+    async def fetch_both() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            return await asyncio.gather(
+                *(
+                    client.get(
+                        "/telemetry/asset_w12_bridge_0042/latest",
+                        headers={**AUTH_HEADERS, "x-trace-id": trace_id},
+                    )
+                    for trace_id in ("trc_A", "trc_B")
+                )
+            )
+
+    responses = asyncio.run(fetch_both())
+
+    assert len(calls) == 1
+    assert [response.status_code for response in responses] == [503, 503]
+    assert [response.json()["error"]["trace_id"] for response in responses] == ["trc_A", "trc_B"]
+
+
 def test_asset_telemetry_maps_unavailable_error(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_fetch(_asset_id: str, _trace_id: str) -> dict:
+    async def fake_fetch(_asset_id: str, _trace_id: str) -> dict:
         raise ApiError(
             status_code=503,
             code="SENSOR_INGESTION_UNAVAILABLE",
@@ -374,7 +798,7 @@ def test_asset_telemetry_maps_unavailable_error(monkeypatch: pytest.MonkeyPatch)
 def test_track_maintenance_verification_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_verification_request(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_verification_request(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
         del trace_id, body
         assert method == "POST"
         assert path == "/verifications/mnt_20260214_0012/track"
@@ -420,7 +844,7 @@ def test_track_maintenance_verification_proxy(monkeypatch: pytest.MonkeyPatch) -
 def test_automation_incidents_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_request_orchestration(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_request_orchestration(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
         del trace_id, body
         assert method == "GET"
         assert path == "/incidents"
@@ -455,11 +879,15 @@ def test_automation_incidents_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_automation_acknowledgement_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_request_orchestration(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_request_orchestration(*, trace_id: str, method: str, path: str, body: dict | BaseModel | None = None) -> dict:
         del trace_id
         assert method == "POST"
         assert path == "/incidents/wf_20260214_120001_0001/acknowledge"
-        assert body == {"acknowledged_by": "ops-chief-01", "ack_notes": "Maintenance team dispatched"}
+        assert isinstance(body, BaseModel)
+        assert body.model_dump(exclude_none=True) == {
+            "acknowledged_by": "ops-chief-01",
+            "ack_notes": "Maintenance team dispatched",
+        }
         return {
             "workflow_id": "wf_20260214_120001_0001",
             "escalation_stage": "acknowledged",
@@ -485,7 +913,7 @@ def test_automation_acknowledgement_proxy(monkeypatch: pytest.MonkeyPatch) -> No
 def test_create_evidence_upload_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_report_generation(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_report_generation(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
         del trace_id
         assert method == "POST"
         assert path == "/maintenance/mnt_20260214_0012/evidence/uploads"
@@ -538,11 +966,12 @@ def test_create_evidence_upload_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_finalize_evidence_upload_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_report_generation(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_report_generation(*, trace_id: str, method: str, path: str, body: dict | BaseModel | None = None) -> dict:
         del trace_id
         assert method == "POST"
         assert path == "/maintenance/mnt_20260214_0012/evidence/evd_20260215_0001/finalize"
-        assert body == {"uploaded_by": "org-admin-01"}
+        assert isinstance(body, BaseModel)
+        assert body.model_dump(exclude_none=True) == {"uploaded_by": "org-admin-01"}
         return {
             "evidence": {
                 "evidence_id": "evd_20260215_0001",
@@ -577,7 +1006,7 @@ def test_finalize_evidence_upload_proxy(monkeypatch: pytest.MonkeyPatch) -> None
 def test_list_evidence_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_report_generation(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_report_generation(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
         del trace_id, body
         assert method == "GET"
         assert path == "/maintenance/mnt_20260214_0012/evidence"
@@ -599,7 +1028,8 @@ def test_list_evidence_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
                     "status": "finalized",
                     "category": "inspection_report",
                     "notes": "Bridge deck crack repair report",
-                }
+                },
+                "not-an-object",
             ]
         }
 
@@ -613,14 +1043,103 @@ def test_list_evidence_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(response.json()["data"]) == 1
 
 
+def test_evidence_list_reuses_recent_read_until_finalize(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    calls: list[str] = []
+    evidence = {
+        "evidence_id": "evd_20260215_0001",
+        "maintenance_id": "mnt_20260214_0012",
+        "asset_id": "asset_w12_bridge_0042",
+        "filename": "repair_report.pdf",
+        "content_type": "application/pdf",
+        "size_bytes": 20480,
+        "storage_uri": "gs://bucket/infraguard/evidence/mnt_20260214_0012/evd_20260215_0001/repair_report.pdf",
+        "storage_object_path": "infraguard/evidence/mnt_20260214_0012/evd_20260215_0001/repair_report.pdf",
+        "sha256_hex": "a" * 64,
+        "uploaded_by": "org-admin-01",
+        "uploaded_at": "2026-02-15T05:00:00+00:00",
+        "finalized_at": "2026-02-15T05:02:00+00:00",
+        "status": "finalized",
+    }
+
+    async def fake_report_generation(
+        *,
+        trace_id: str,
+        method: str,
+        path: str,
+        body: dict | BaseModel | None = None,
+    ) -> dict:
+        del trace_id, body
+        calls.append(method)
+        if method == "POST":
+            return {"evidence": evidence}
+        return {"items": [evidence]}
+
+    monkeypatch.setattr(gateway_routes, "_request_report_generation", fake_report_generation)
+
+    for _ in range(2):
+        response = client.get("/maintenance/mnt_20260214_0012/evidence", headers=AUTH_HEADERS)
+        assert response.status_code == 200
+    assert calls == ["GET"]
+
+    finalized = client.post(
+        "/maintenance/mnt_20260214_0012/evidence/evd_20260215_0001/finalize",
+        headers=AUTH_HEADERS,
+        json={"uploaded_by": "org-admin-01"},
+    )
+    assert finalized.status_code == 200
+
+    response = client.get("/maintenance/mnt_20260214_0012/evidence", headers=AUTH_HEADERS)
+    assert response.status_code == 200
+    assert calls == ["GET", "POST", "GET"]
+
+
+def test_coalesced_verification_reads_keep_each_caller_trace_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def fake_verification_request(
+        *,
+        trace_id: str,
+        method: str,
+        path: str,
+        body: dict | BaseModel | None = None,
+    ) -> dict:
+        del method, path, body
+        calls.append(trace_id)
+        await asyncio.sleep(0.02)
+        raise ApiError(status_code=404, code="NOT_FOUND", message="Verification record not found.", trace_id=trace_id)
+
+    monkeypatch.setattr(gateway_routes, "_request_blockchain_verification", fake_verification_request)
+
+    async def fetch_both() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            return await asyncio.gather(
+                *(
+                    client.get(
+                        "/maintenance/mnt_20260214_0012/verification",
+                        headers={**AUTH_HEADERS, "x-trace-id": trace_id},
+                    )
+                    for trace_id in ("trc_A", "trc_B")
+                )
+            )
+
+    responses = asyncio.run(fetch_both())
+
+    assert len(calls) == 1
+    assert [response.status_code for response in responses] == [404, 404]
+    assert [response.json()["error"]["trace_id"] for response in responses] == ["trc_A", "trc_B"]
+
+
 def test_submit_verification_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
     client = TestClient(app)
 
-    def fake_request_orchestration(*, trace_id: str, method: str, path: str, body: dict | None = None) -> dict:
+    async def fake_request_orchestration(*, trace_id: str, method: str, path: str, body: dict | BaseModel | None = None) -> dict:
         del trace_id
         assert method == "POST"
         assert path == "/maintenance/mnt_20260214_0012/verification/submit"
-        assert body is not None
+        assert isinstance(body, BaseModel)
+        assert body.model_dump(exclude_none=True)["submitted_by"]
         return {
             "workflow_id": "wf_20260214_120001_0001",
             "maintenance_id": "mnt_20260214_0012",
@@ -649,8 +1168,12 @@ def test_evidence_routes_require_organization_role(monkeypatch: pytest.MonkeyPat
         "API_GATEWAY_AUTH_TOKEN_ROLES_CSV",
         "dev-token:organization|operator,operator-token:operator",
     )
+    get_settings.cache_clear()
     headers = {"Authorization": "Bearer operator-token", "x-trace-id": "trc_test_gateway_001"}
 
-    response = client.get("/maintenance/mnt_20260214_0012/evidence", headers=headers)
+    try:
+        response = client.get("/maintenance/mnt_20260214_0012/evidence", headers=headers)
+    finally:
+        get_settings.cache_clear()
     assert response.status_code == 403
     assert response.json()["error"]["code"] == "FORBIDDEN"
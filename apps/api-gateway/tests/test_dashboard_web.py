@@ -32,6 +32,20 @@ def test_dashboard_page_served() -> None:
     assert "evidence-list-body" in response.text
 
 
+def test_dashboard_page_honours_etag() -> None:
+    client = TestClient(app)
+    first = client.get("/dashboard")
+    etag = first.headers["etag"]
+
+    cached = client.get("/dashboard", headers={"if-none-match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    for header in (f"W/{etag}", f'"stale", {etag}', "*"):
+        assert client.get("/dashboard", headers={"if-none-match": header}).status_code == 304
+    assert client.get("/dashboard", headers={"if-none-match": '"stale"'}).status_code == 200
+
+
 def test_dashboard_static_assets_served() -> None:
     client = TestClient(app)
     css = client.get("/dashboard-static/styles.css")
@@ -99,26 +99,29 @@ def test_gateway_openapi_paths_and_responses() -> None:
     assert forecast.status_code == 200
     _validate(spec, "AssetForecastResponse", forecast.json())
 
-    gateway_routes._fetch_sensor_telemetry = lambda _asset_id, _trace_id: {
-        "asset_id": "asset_w12_bridge_0042",
-        "source": "firebase",
-        "captured_at": "2026-02-14T07:05:00+00:00",
-        "sensors": {
-            "strain": {"value": 12.9, "unit": "me", "delta": "+0.2 variance", "samples": [12.0, 12.4, 12.7, 12.9]},
-            "vibration": {"value": 1.3, "unit": "mm/s", "delta": "+0.1 trend", "samples": [1.0, 1.1, 1.2, 1.3]},
-            "temperature": {"value": 28.5, "unit": "C", "delta": "+0.4 spike", "samples": [27.8, 28.0, 28.2, 28.5]},
-            "tilt": {"value": 3.1, "unit": "deg", "delta": "+0.2 drift", "samples": [2.6, 2.8, 2.9, 3.1]},
-        },
-        "computed": {
-            "acceleration_magnitude_g": 1.01,
-            "vibration_rms_ms2": 1.3,
-            "tilt_deg": 3.1,
-            "strain_proxy_microstrain": 12.9,
-            "thermal_stress_index": 0.31,
-            "fatigue_index": 0.20,
-            "health_proxy_score": 0.79,
-        },
-    }
+    async def fake_fetch_sensor_telemetry(_asset_id: str, _trace_id: str) -> dict:
+        return {
+            "asset_id": "asset_w12_bridge_0042",
+            "source": "firebase",
+            "captured_at": "2026-02-14T07:05:00+00:00",
+            "sensors": {
+                "strain": {"value": 12.9, "unit": "me", "delta": "+0.2 variance", "samples": [12.0, 12.4, 12.7, 12.9]},
+                "vibration": {"value": 1.3, "unit": "mm/s", "delta": "+0.1 trend", "samples": [1.0, 1.1, 1.2, 1.3]},
+                "temperature": {"value": 28.5, "unit": "C", "delta": "+0.4 spike", "samples": [27.8, 28.0, 28.2, 28.5]},
+                "tilt": {"value": 3.1, "unit": "deg", "delta": "+0.2 drift", "samples": [2.6, 2.8, 2.9, 3.1]},
+            },
+            "computed": {
+                "acceleration_magnitude_g": 1.01,
+                "vibration_rms_ms2": 1.3,
+                "tilt_deg": 3.1,
+                "strain_proxy_microstrain": 12.9,
+                "thermal_stress_index": 0.31,
+                "fatigue_index": 0.20,
+                "health_proxy_score": 0.79,
+            },
+        }
+
+    gateway_routes._fetch_sensor_telemetry = fake_fetch_sensor_telemetry
 
     telemetry = client.get("/telemetry/asset_w12_bridge_0042/latest", headers=AUTH_HEADERS)
     assert telemetry.status_code == 200
@@ -128,18 +131,21 @@ def test_gateway_openapi_paths_and_responses() -> None:
     assert verification.status_code == 200
     _validate(spec, "MaintenanceVerificationResponse", verification.json())
 
-    gateway_routes._connect_blockchain_service = lambda _trace_id: {
-        "connected": True,
-        "network": "sepolia",
-        "expected_chain_id": 11155111,
-        "chain_id": 11155111,
-        "latest_block": 100005,
-        "contract_address": "0x" + "1" * 40,
-        "contract_deployed": True,
-        "checked_at": "2026-02-14T06:10:00+00:00",
-        "message": "Connected to Sepolia RPC.",
-        "source": "services/blockchain-verification-service",
-    }
+    async def fake_connect_blockchain_service(_trace_id: str) -> dict:
+        return {
+            "connected": True,
+            "network": "sepolia",
+            "expected_chain_id": 11155111,
+            "chain_id": 11155111,
+            "latest_block": 100005,
+            "contract_address": "0x" + "1" * 40,
+            "contract_deployed": True,
+            "checked_at": "2026-02-14T06:10:00+00:00",
+            "message": "Connected to Sepolia RPC.",
+            "source": "services/blockchain-verification-service",
+        }
+
+    gateway_routes._connect_blockchain_service = fake_connect_blockchain_service
 
     connect = client.post("/blockchain/connect", headers=AUTH_HEADERS)
     assert connect.status_code == 200